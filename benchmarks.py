@@ -0,0 +1,415 @@
+"""
+benchmarks.py
+
+Author: Liam Mills
+Created: 2026-10-17
+Last Modified: 2026-10-17
+
+Implements a benchmark suite for the functions in this repository, which times them on synthetic inputs of growing
+sizes, and compares the results against a stored baseline to catch performance regressions.
+
+Dependencies:
+    - NumPy
+    - NetworkX (for the kruskal benchmarks)
+
+Functions:
+    - runBenchmarks(preset: str = "quick", seed: int = 0) -> list[dict]: Runs every benchmark case at the sizes of the
+    preset, and returns the time, peak memory and throughput of each.
+    - benchmarkCase(name: str, size: int, items: int, run: Callable[[], object], repeat: int = 3) -> dict: Times one
+    benchmark case, and measures its peak memory.
+    - benchmarkImport(module: str) -> dict: Measures the time taken to import a module in a fresh interpreter.
+    - compareToBaseline(results: list[dict], baseline: list[dict], tolerance: float = 0.25, min_seconds: float = 0.01) -> list[dict]: Returns the
+    cases that are slower than the baseline by more than the tolerance.
+    - makeCorpus(size_bytes: int, seed: int = 0) -> list[str]: Returns a synthetic list of words of roughly size_bytes.
+    - makeConnectedGraph(edge_count: int, seed: int = 0) -> nx.Graph: Returns a synthetic connected graph with
+    edge_count weighted edges.
+    - main() -> None: Command line entry point, run with python benchmarks.py --help for the options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import collatz
+import find_most_frequent
+import knights_tour
+import minimum_spanning_trees
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+# CONSTANTS
+# modules whose import time is measured
+MODULES = ["collatz", "find_most_frequent", "knights_tour", "minimum_spanning_trees"]
+
+# sizes of each benchmark, for the quick and full presets
+#
+# collatz = the limit of the range of start values
+# corpus = the size of the synthetic corpus in bytes
+# board = the rows and columns of the board and the starting square of the backtracking tour
+# warnsdorff = the rows and columns of the board of the Warnsdorff tour
+# divide = the rows and columns of the board of the divide and conquer tour
+# edges = the number of edges of the synthetic graph
+PRESETS = {
+    "quick": {
+        "collatz": [10 ** 3, 10 ** 4, 10 ** 5],
+        "corpus": [10 ** 3, 10 ** 4, 10 ** 5],
+        "board": [((6, 6), (2, 2)), ((6, 8), (0, 0)), ((8, 8), (0, 0))],
+        "warnsdorff": [(8, 8), (16, 16)],
+        "divide": [(100, 100), (500, 500)],
+        "edges": [10 ** 2, 3 * 10 ** 2],
+    },
+    "full": {
+        "collatz": [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7],
+        "corpus": [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7],
+        "board": [((6, 6), (2, 2)), ((6, 8), (0, 0)), ((8, 8), (0, 0)), ((8, 8), (2, 2)), ((10, 10), (0, 0))],
+        "warnsdorff": [(8, 8), (16, 16), (32, 32), (64, 64)],
+        "divide": [(100, 100), (500, 500), (2000, 2000)],
+        "edges": [10 ** 2, 10 ** 3, 10 ** 4],
+    },
+}
+
+# largest range the recursive, printing collatz function is timed over
+COLLATZ_RECURSIVE_LIMIT = 10 ** 4
+
+# number of random start squares timed for the Las Vegas tour
+LAS_VEGAS_RUNS = 200
+
+# number of distinct words in the synthetic corpora
+VOCABULARY_SIZE = 5000
+
+# words excluded in the findMostFrequentWord benchmark
+EXCLUDED_WORDS = ["the", "a", "of", "and", "to", "in"]
+
+def runBenchmarks(preset: str = "quick", seed: int = 0) -> list[dict]:
+    """
+    Function that runs every benchmark case at the sizes of the preset.
+
+    Args:
+        - preset (string): "quick" or "full", the sizes to run.
+        - seed (integer): Seed for the synthetic inputs, so every run
+        times the same inputs.
+
+    Returns:
+        - list[dict]: The result of each case, see benchmarkCase.
+
+    Side Effects:
+        - Prints the result of each case as it finishes.
+    """
+
+    import numpy as np
+
+    sizes = PRESETS[preset]
+    results = []
+
+    def record(result: dict) -> None:
+        results.append(result)
+        print(f"{result['name']:<36} size={result['size']:<10} {result['seconds']:.4f}s {result['peak_memory_bytes'] / 1024:.0f}KiB {result['items_per_second']:.0f}/s")
+
+    # import time of each module, in a fresh interpreter
+    for module in MODULES:
+        record(benchmarkImport(module))
+
+    # collatz
+    for limit in sizes["collatz"]:
+        record(benchmarkCase("collatzStoppingTimes", limit, limit, lambda: collatz.collatzStoppingTimes(limit)))
+        record(benchmarkCase("collatzBatch", limit, limit, lambda: collatz.collatzBatch(np.arange(1, limit + 1))))
+
+        if limit <= COLLATZ_RECURSIVE_LIMIT:
+            record(benchmarkCase("collatz", limit, limit, lambda: _quietly(lambda: [collatz.collatz(n) for n in range(1, limit + 1)])))
+
+    # find_most_frequent
+    for size_bytes in sizes["corpus"]:
+        corpus = makeCorpus(size_bytes, seed)
+        record(benchmarkCase("findMostFrequentWord", size_bytes, len(corpus), lambda: find_most_frequent.findMostFrequentWord(corpus, EXCLUDED_WORDS)))
+        record(benchmarkCase("findMostFrequentFollower", size_bytes, len(corpus), lambda: find_most_frequent.findMostFrequentFollower(corpus, "the")))
+
+    # knights_tour
+    for (board_size, starting_position) in sizes["board"]:
+        record(benchmarkCase("KnightsTourBacktracking", board_size[0] * board_size[1], 1, lambda: knights_tour.KnightsTourBacktracking(starting_position, board_size), repeat=1))
+
+    for board_size in sizes["warnsdorff"]:
+        record(benchmarkCase("KnightsTourWarnsdorff", board_size[0] * board_size[1], 1, lambda: knights_tour.KnightsTourWarnsdorff((0, 0), board_size)))
+
+    for board_size in sizes["divide"]:
+        record(benchmarkCase("KnightsTourDivideAndConquer", board_size[0] * board_size[1], board_size[0] * board_size[1], lambda: knights_tour.KnightsTourDivideAndConquer(board_size), repeat=1))
+
+    def lasVegasRuns() -> None:
+        np.random.seed(seed)
+        for _ in range(LAS_VEGAS_RUNS):
+            start = np.random.randint(0, knights_tour.BOARD_SIZE, 2)
+            knights_tour.KnightsTourLasVegas((int(start[0]), int(start[1])))
+
+    record(benchmarkCase("KnightsTourLasVegas", knights_tour.BOARD_SIZE, LAS_VEGAS_RUNS, lasVegasRuns))
+
+    # minimum_spanning_trees
+    for edge_count in sizes["edges"]:
+        graph = makeConnectedGraph(edge_count, seed)
+        record(benchmarkCase("kruskal", edge_count, edge_count, lambda: minimum_spanning_trees.kruskal(graph, verbose=False), repeat=1))
+
+    return results
+
+def benchmarkCase(name: str, size: int, items: int, run: Callable[[], object], repeat: int = 3) -> dict:
+    """
+    Function that times one benchmark case, then runs it once more
+    with tracemalloc to measure its peak memory, as tracing slows the
+    code down too much to time it at the same time.
+
+    Args:
+        - name (string): Name of the function being benchmarked.
+        - size (integer): Size of the input, used with name as the key
+        when comparing against a baseline.
+        - items (integer): Number of items the input holds, used to
+        work out the throughput.
+        - run (function): Function that runs the case once.
+        - repeat (integer): Number of timed runs, the fastest is kept.
+
+    Returns:
+        - dictionary: The name, size, seconds, peak_memory_bytes and
+        items_per_second of the case.
+    """
+
+    # keep the fastest run, as it has the least noise from
+    # the rest of the machine
+    seconds = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        run()
+        seconds = min(seconds, time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        run()
+        (_, peak_memory_bytes) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "name": name,
+        "size": size,
+        "seconds": seconds,
+        "peak_memory_bytes": peak_memory_bytes,
+        "items_per_second": items / seconds if seconds > 0 else 0.0,
+    }
+
+def benchmarkImport(module: str) -> dict:
+    """
+    Function that measures the time taken to import a module in a fresh
+    interpreter, read from the output of python -X importtime.
+
+    Args:
+        - module (string): Name of the module to import.
+
+    Returns:
+        - dictionary: The same keys as benchmarkCase, with the name
+        "import <module>", a size of 0, and a peak memory of 0.
+    """
+
+    # run from this folder, so the modules can be found
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    # the last line is the module itself, and its second column is
+    # the cumulative time in microseconds, including its own imports
+    cumulative_microseconds = int(completed.stderr.strip().splitlines()[-1].split("|")[1])
+    seconds = cumulative_microseconds / 1e6
+
+    return {
+        "name": f"import {module}",
+        "size": 0,
+        "seconds": seconds,
+        "peak_memory_bytes": 0,
+        "items_per_second": 1 / seconds if seconds > 0 else 0.0,
+    }
+
+def compareToBaseline(results: list[dict], baseline: list[dict], tolerance: float = 0.25, min_seconds: float = 0.01) -> list[dict]:
+    """
+    Function that compares benchmark results against a baseline, matching
+    the cases by name and size.
+
+    Args:
+        - results (list[dict]): Results of the current run.
+        - baseline (list[dict]): Results of the baseline run.
+        - tolerance (float): Allowed slowdown as a fraction, i.e. 0.25
+        allows a case to be up to 25% slower than the baseline.
+        - min_seconds (float): Cases faster than this in the baseline
+        are skipped, as timings that short are mostly noise.
+
+    Returns:
+        - list[dict]: The name, size, baseline_seconds, seconds and
+        slowdown of each case that regressed. Cases missing from the
+        baseline are skipped.
+    """
+
+    baseline_seconds = {(case["name"], case["size"]): case["seconds"] for case in baseline}
+    regressions = []
+
+    for case in results:
+        key = (case["name"], case["size"])
+
+        if key not in baseline_seconds or baseline_seconds[key] < min_seconds:
+            continue
+
+        slowdown = case["seconds"] / baseline_seconds[key]
+
+        if slowdown > 1 + tolerance:
+            regressions.append({
+                "name": case["name"],
+                "size": case["size"],
+                "baseline_seconds": baseline_seconds[key],
+                "seconds": case["seconds"],
+                "slowdown": slowdown,
+            })
+
+    return regressions
+
+def makeCorpus(size_bytes: int, seed: int = 0) -> list[str]:
+    """
+    Function that returns a synthetic list of words of roughly
+    size_bytes, drawn from a vocabulary with a Zipf-like distribution
+    like real text, with some punctuation mixed in.
+
+    Args:
+        - size_bytes (integer): Approximate size of the corpus, counting
+        one byte per character and separating space.
+        - seed (integer): Seed for the random words.
+
+    Returns:
+        - list[str]: The words of the corpus.
+    """
+
+    generator = random.Random(seed)
+
+    vocabulary = EXCLUDED_WORDS + [f"word{index}" for index in range(VOCABULARY_SIZE - len(EXCLUDED_WORDS))]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    punctuation = ["", "", "", "", ",", ".", "!", "?"]
+
+    corpus = []
+    total = 0
+
+    # draw in batches, as random.choices is much faster that way
+    while total < size_bytes:
+        for word in generator.choices(vocabulary, weights, k=1024):
+            word += generator.choice(punctuation)
+            corpus.append(word)
+            total += len(word) + 1
+
+            if total >= size_bytes:
+                break
+
+    return corpus
+
+def makeConnectedGraph(edge_count: int, seed: int = 0) -> nx.Graph:
+    """
+    Function that returns a synthetic connected graph with edge_count
+    weighted edges, built from a random spanning tree with random extra
+    edges added on top.
+
+    Args:
+        - edge_count (integer): Number of edges, at least 1.
+        - seed (integer): Seed for the random edges and weights.
+
+    Returns:
+        - nx.Graph: The connected graph, with distinct integer weights.
+    """
+
+    import networkx as nx
+
+    generator = random.Random(seed)
+
+    # roughly 4 edges for each node, and enough nodes for a spanning tree
+    node_count = max(2, min(edge_count + 1, edge_count // 4))
+
+    edges = set()
+
+    # random spanning tree, so the graph is connected
+    for node in range(1, node_count):
+        edges.add((generator.randrange(node), node))
+
+    # random extra edges, up to the requested count
+    max_edges = node_count * (node_count - 1) // 2
+    while len(edges) < min(edge_count, max_edges):
+        (node_one, node_two) = sorted(generator.sample(range(node_count), 2))
+        edges.add((node_one, node_two))
+
+    # distinct weights, so the minimum spanning tree is unique
+    weights = generator.sample(range(1, len(edges) * 10 + 1), len(edges))
+
+    graph = nx.Graph()
+    graph.add_weighted_edges_from((f"n{node_one}", f"n{node_two}", weight) for ((node_one, node_two), weight) in zip(sorted(edges), weights))
+
+    return graph
+
+def _quietly(run: Callable[[], object]) -> object:
+    """
+    Function that runs a function while throwing away what it prints.
+
+    Args:
+        - run (function): Function to run.
+
+    Returns:
+        - object: The return value of run.
+    """
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return run()
+
+def main() -> None:
+    """
+    Command line entry point, which runs the benchmarks, saves the results
+    to a JSON file, and compares them against a baseline if one is given.
+
+    Side Effects:
+        - Prints the results and any regressions to the console.
+        - Writes the results file.
+        - Exits with status 1 if a case regressed.
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark the functions in this repository.")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick", help="sizes to run (default: quick)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic inputs (default: 0)")
+    parser.add_argument("--output", default="benchmark_results.json", help="file to save the results to")
+    parser.add_argument("--baseline", help="results file of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown against the baseline (default: 0.25)")
+    args = parser.parse_args()
+
+    results = runBenchmarks(args.preset, args.seed)
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump({
+            "preset": args.preset,
+            "seed": args.seed,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }, file, indent=2)
+
+    print(f"\nSaved the results to {args.output}.")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+
+        regressions = compareToBaseline(results, baseline, args.tolerance)
+
+        for case in regressions:
+            print(f"Regression: {case['name']} size={case['size']} took {case['seconds']:.4f}s, {case['slowdown']:.2f}x the baseline of {case['baseline_seconds']:.4f}s.")
+
+        if regressions:
+            sys.exit(1)
+
+        print("No regressions against the baseline.")
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,74 @@ collatz.py
 
 Author: Liam Mills
 Created: 2025-10-15
-Last Modified: 2025-11-1
+Last Modified: 2026-10-17
 
 Implements recursive and iterative functions related to the Collatz conjecture.
 
+Dependencies:
+    - NumPy (imported on first use)
+
 Functions:
     - collatz(n: int) -> int: Return the result of the Collatz sequence starting from n down to 1.
+    - collatzStoppingTimes(limit: int, cache_size: int = 1 << 22, overflow_cache_size: int = 1 << 16) -> dict: Returns
+    summaries of the stopping times of every start value from 1 to limit, computed iteratively with a bounded cache.
+    - collatzBatch(start_values: np.ndarray) -> tuple[np.ndarray, np.ndarray]: Returns the stopping times and peak
+    values of an array of start values, moving them all forward together with vectorised updates.
+    - collatzRecordSearch(limit: int, chunk_size: int = 1 << 20, processes: int | None = None, checkpoint_path: str | None = None,
+    cache_size: int = 1 << 22, table_path: str | None = None) -> dict: Returns the stopping time record holders up to limit, searched in shards on a process pool.
+    - collatzJumpStoppingTime(n: int, k: int = 16) -> int: Returns the stopping time of n, advancing up to k parity steps
+    per table lookup.
+    - collatzJumpBenchmark(limit: int, k: int = 16) -> dict: Times the jump table stopping times against the step by
+    step version for every start value from 1 to limit.
+    - collatzBigInt(n: int) -> tuple[int, int]: Returns the stopping time and peak bit length of a large n, removing
+    runs of trailing zero bits in one shift.
+    - collatzTrajectory(n: int, stride: int = 1, stop_when: Callable[[int], bool] | None = None) -> Iterator[int]: Lazily
+    yields the values of the Collatz sequence starting from n, without printing.
+    - collatzStepCount(n: int) -> int: Returns the number of steps of the Collatz sequence from n down to 1, without printing.
+    - collatzTable(path: str, limit: int) -> np.memmap: Returns a read only memory-mapped table of the stopping times from
+    0 to at least limit, stored on disk and grown when a larger limit is requested.
+    - collatzTableLookup(table: np.ndarray, n: int) -> int: Returns the stopping time of n, using the table when n is in it.
+    - main() -> None: Runs the collatz function for a few test values, used when the file is run as a script.
 """
 
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING
+
+# NumPy is only imported for type checking here, the functions that
+# need it import it on first use, so importing this file stays fast
+if TYPE_CHECKING:
+    import numpy as np
+
+# CONSTANTS
+# default number of start values with a dense entry in the stopping time cache
+DEFAULT_CACHE_SIZE = 1 << 22
+
+# default number of entries kept in the LRU cache for values above the dense cache
+DEFAULT_OVERFLOW_CACHE_SIZE = 1 << 16
+
+# default number of start values in each shard of a record search
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# default and allowed number of parity steps in each jump table lookup
+DEFAULT_JUMP_BITS = 16
+MIN_JUMP_BITS = 1
+MAX_JUMP_BITS = 20
+
+# on-disk type of the stopping time table entries, little endian
+# so the file can be shared between machines
+TABLE_DTYPE = "<u2"
+
+# largest odd value whose 3n + 1 still fits in an int64
+INT64_ODD_LIMIT = ((1 << 63) - 2) // 3
+
 def collatz(n: int) -> int:
     """
     Recursive function that runs through the Collatz conjecture
@@ -48,7 +108,802 @@ def collatz(n: int) -> int:
         print(f"n={n}.")
         return collatz(3 * n + 1)
 
-# test code is working  
-for n in range(-1, 6):
-    print(f"Starting collatz function with n={n}: ")
-    collatz(n)
\ No newline at end of file
+def collatzStoppingTimes(limit: int, cache_size: int = DEFAULT_CACHE_SIZE, overflow_cache_size: int = DEFAULT_OVERFLOW_CACHE_SIZE) -> dict:
+    """
+    Iterative function that finds the stopping time (the number of
+    steps needed to reach 1) for every start value from 1 to limit
+
+    Previously computed stopping times are reused, so each start value
+    only walks its trajectory until it meets a value that is already
+    known. The cache is bounded:
+        - Values below cache_size are stored in a dense array, and
+        are never evicted, as small values are the most reused.
+        - Values at or above cache_size are stored in an LRU cache
+        of at most overflow_cache_size entries, which evicts the
+        least recently used value when it is full.
+
+    Args:
+        - limit (integer): Positive integer, the last start value to
+        compute the stopping time of.
+        - cache_size (integer): Number of values with a dense entry
+        in the cache.
+        - overflow_cache_size (integer): Maximum number of entries in
+        the LRU cache for values above cache_size.
+
+    Returns:
+        - dictionary: The keys are:
+            - max_steps (integer): The largest stopping time found.
+            - argmax (integer): The first start value with max_steps.
+            - histogram (dict[int, int]): The number of start values
+            for each stopping time.
+        If a number lower than 1 is supplied, an empty dictionary
+        is returned.
+
+    Side Effects:
+        - Prints an error message if a number lower than 1 is supplied.
+    """
+
+    if limit < 1:
+        print(f"Err: The number supplied was lower than one ({limit}).")
+        return {}
+
+    # dense cache, only as large as the range needs, 'H' is wide
+    # enough as every stopping time below 2^64 is under 65536
+    table = array("H", [0]) * max(2, min(cache_size, limit + 1))
+
+    # LRU cache of values too large for the dense cache
+    overflow = OrderedDict()
+
+    # running summaries of the stopping times
+    max_steps = 0
+    argmax = 1
+    histogram = {}
+
+    for n in range(1, limit + 1):
+        steps = _collatzCachedStoppingTime(n, table, overflow, overflow_cache_size)
+
+        # only a strictly larger value moves the argmax, so the
+        # first start value with the max is kept
+        if steps > max_steps:
+            max_steps = steps
+            argmax = n
+
+        histogram[steps] = histogram.get(steps, 0) + 1
+
+    return {
+        "max_steps": max_steps,
+        "argmax": argmax,
+        "histogram": dict(sorted(histogram.items())),
+    }
+
+def _collatzCachedStoppingTime(n: int, table: array, overflow: OrderedDict, overflow_cache_size: int) -> int:
+    """
+    Function that finds the stopping time of n, walking its trajectory
+    until it meets a cached value, then caching every value on the way.
+
+    Args:
+        - n (integer): Positive integer to find the stopping time of.
+        - table (array or np.ndarray): Dense cache, where table[m] is the
+        stopping time of m, or 0 when it is not known yet. A read only
+        table must already be complete, so the walk never writes to it.
+        - overflow (OrderedDict): LRU cache for values too large for table.
+        - overflow_cache_size (integer): Maximum size of overflow.
+
+    Returns:
+        - integer: The stopping time of n.
+    """
+
+    table_size = len(table)
+
+    # values walked through that are not cached yet
+    path = []
+    m = n
+
+    while True:
+        if m < table_size:
+            # 1 has a stopping time of 0, which is also the
+            # marker for an unknown value, so check it directly
+            if m == 1 or table[m]:
+                steps = int(table[m])
+                break
+        else:
+            steps = overflow.get(m)
+            if steps is not None:
+                # mark as recently used
+                overflow.move_to_end(m)
+                break
+
+        path.append(m)
+        m = m >> 1 if m & 1 == 0 else 3 * m + 1
+
+    # cache the walked values, from the closest to 1 outwards
+    for m in reversed(path):
+        steps += 1
+        if m < table_size:
+            table[m] = steps
+        elif overflow_cache_size > 0:
+            overflow[m] = steps
+            # evict the least recently used value
+            if len(overflow) > overflow_cache_size:
+                overflow.popitem(last=False)
+
+    return steps
+
+def collatzBatch(start_values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Function that runs the Collatz sequence for an array of start
+    values at once, using masked vectorised even/odd updates
+
+    Each start value is a lane. At every iteration the odd lanes
+    are set to 3n + 1 and the even lanes to n / 2, and the lanes that
+    reach 1 drop out of the active set. If a lane would go past the
+    int64 range, it is moved to an exact Python integer path instead.
+
+    Args:
+        - start_values (np.ndarray): Array of integers used as the
+        start values.
+
+    Returns:
+        - tuple[np.ndarray, np.ndarray]: The stopping time of each
+        start value, and the peak value of each trajectory, in the
+        same shape as start_values. Lanes with a start value lower
+        than 1 have a stopping time and peak of -1. The peaks are
+        int64, unless a lane overflowed, then they are Python
+        integers in an object array.
+    """
+
+    import numpy as np
+
+    start_values = np.asarray(start_values, dtype=np.int64)
+    shape = start_values.shape
+    start_values = start_values.ravel()
+
+    # output arrays, invalid lanes are marked with -1
+    steps = np.zeros(start_values.size, dtype=np.int64)
+    peaks = start_values.copy()
+    invalid = start_values < 1
+    steps[invalid] = -1
+    peaks[invalid] = -1
+
+    # lanes that went past int64, handled after the vectorised loop
+    overflowed = []
+
+    # active set, the index, current value, steps and peak of each lane
+    active = np.flatnonzero(start_values > 1)
+    values = start_values[active]
+    lane_steps = np.zeros(active.size, dtype=np.int64)
+    lane_peaks = values.copy()
+
+    while active.size:
+        running = values != 1
+        running_count = int(np.count_nonzero(running))
+
+        # drop the lanes that reached 1, only once at least half of the
+        # lanes are done, so the arrays are not compacted every iteration
+        if running_count * 2 <= active.size:
+            done = ~running
+            steps[active[done]] = lane_steps[done]
+            peaks[active[done]] = lane_peaks[done]
+            active = active[running]
+            values = values[running]
+            lane_steps = lane_steps[running]
+            lane_peaks = lane_peaks[running]
+            running = running[running]
+
+            if active.size == 0:
+                break
+
+        odd = (values & 1) == 1
+
+        # move the lanes that would overflow to the exact path
+        too_large = odd & (values > INT64_ODD_LIMIT)
+        if too_large.any():
+            overflowed.extend(zip(active[too_large].tolist(), values[too_large].tolist(), lane_steps[too_large].tolist(), lane_peaks[too_large].tolist()))
+            keep = ~too_large
+            active = active[keep]
+            values = values[keep]
+            lane_steps = lane_steps[keep]
+            lane_peaks = lane_peaks[keep]
+            running = running[keep]
+            odd = odd[keep]
+
+        # masked even/odd updates, lanes at 1 are held at 1
+        values = np.where(running, np.where(odd, 3 * values + 1, values >> 1), values)
+        lane_steps += running
+        np.maximum(lane_peaks, values, out=lane_peaks)
+
+    if overflowed:
+        peaks = peaks.astype(object)
+
+        # finish each overflowed lane with Python integers
+        for (index, value, lane_step, lane_peak) in overflowed:
+            (extra_steps, peak) = _collatzStepsAndPeak(value)
+            steps[index] = lane_step + extra_steps
+            peaks[index] = max(lane_peak, peak)
+
+    return (steps.reshape(shape), peaks.reshape(shape))
+
+def _collatzStepsAndPeak(n: int) -> tuple[int, int]:
+    """
+    Function that runs the Collatz sequence from n with Python
+    integers, which cannot overflow.
+
+    Args:
+        - n (integer): Positive integer used as the start value.
+
+    Returns:
+        - tuple[int, int]: The number of steps taken to reach 1, and
+        the largest value of the trajectory.
+    """
+
+    steps = 0
+    peak = n
+
+    while n != 1:
+        n = n >> 1 if n & 1 == 0 else 3 * n + 1
+        steps += 1
+        if n > peak:
+            peak = n
+
+    return (steps, peak)
+
+def collatzRecordSearch(limit: int, chunk_size: int = DEFAULT_CHUNK_SIZE, processes: int | None = None, checkpoint_path: str | None = None, cache_size: int = DEFAULT_CACHE_SIZE, table_path: str | None = None) -> dict:
+    """
+    Function that searches for the stopping time record holders up to
+    limit, which are the start values with a larger stopping time than
+    every smaller start value
+
+    The range is split into shards of chunk_size start values, which
+    are run on a process pool. The results are merged in order as they
+    arrive, and after each merge the progress is saved to the checkpoint
+    file, so a killed search can be resumed by calling the function
+    again with the same arguments.
+
+    The dense stopping time cache, at most limit + 1 values, is built
+    once with collatzTable before the pool starts, and every worker maps
+    the same file read only, instead of each building its own copy.
+
+    Args:
+        - limit (integer): Positive integer, the last start value to search.
+        - chunk_size (integer): Number of start values in each shard.
+        - processes (integer): Number of worker processes, defaults to
+        the number of CPUs.
+        - checkpoint_path (string): Path of the JSON checkpoint file, if
+        None, progress is not saved.
+        - cache_size (integer): Number of values in the dense stopping
+        time cache the workers share.
+        - table_path (string): Path of the stopping time table file, so
+        the cache is reused by later searches, if None, a temporary file
+        is used and removed afterwards.
+
+    Returns:
+        - dictionary: The keys are:
+            - records (list[list[int]]): The start value and stopping
+            time of each record holder, in increasing order.
+            - shard_stats (list[dict]): The start, end, seconds and
+            numbers_per_second of each shard run by this call.
+        If a number lower than 1 is supplied, an empty dictionary
+        is returned.
+
+    Side Effects:
+        - Prints an error message if a number lower than 1 is supplied.
+        - Writes the checkpoint file, if checkpoint_path is supplied.
+        - Creates or appends to the table file, if table_path is supplied.
+    """
+
+    if limit < 1 or chunk_size < 1:
+        print(f"Err: The number supplied was lower than one ({min(limit, chunk_size)}).")
+        return {}
+
+    # state of the search, start value 1 is always the first record
+    checkpoint = {
+        "limit": limit,
+        "chunk_size": chunk_size,
+        "next_start": 2,
+        "records": [[1, 0]],
+    }
+
+    # resume from the checkpoint if it belongs to the same search
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        with open(checkpoint_path, "r", encoding="utf-8") as file:
+            saved = json.load(file)
+
+        if saved.get("limit") == limit and saved.get("chunk_size") == chunk_size:
+            checkpoint = saved
+
+    records = checkpoint["records"]
+    best_steps = records[-1][1]
+    shard_stats = []
+
+    # shards still to run, as [start, end) ranges
+    shards = [(start, min(start + chunk_size, limit + 1)) for start in range(checkpoint["next_start"], limit + 1, chunk_size)]
+
+    if shards:
+        import multiprocessing
+
+        with tempfile.TemporaryDirectory() as directory:
+            # build the dense cache once, no larger than the search needs
+            if table_path is None:
+                table_path = os.path.join(directory, "stopping_times.bin")
+            collatzTable(table_path, max(1, min(cache_size, limit + 1) - 1))
+
+            with multiprocessing.Pool(processes, initializer=_collatzRecordSearchInit, initargs=(table_path,)) as pool:
+                # imap returns the shards in order, so the records
+                # can be merged as a stream
+                for shard in pool.imap(_collatzRecordSearchShard, shards):
+                    # the shard's own records are the only candidates,
+                    # keep the ones that beat every earlier shard
+                    for (n, steps) in shard["records"]:
+                        if steps > best_steps:
+                            records.append([n, steps])
+                            best_steps = steps
+
+                    shard_stats.append(shard["stats"])
+
+                    if checkpoint_path is not None:
+                        checkpoint["next_start"] = shard["stats"]["end"]
+                        _collatzSaveCheckpoint(checkpoint_path, checkpoint)
+
+    return {
+        "records": records,
+        "shard_stats": shard_stats,
+    }
+
+# shared dense cache and LRU cache of each record search worker process
+_search_table = array("H")
+_search_overflow = OrderedDict()
+
+def _collatzRecordSearchInit(table_path: str) -> None:
+    """
+    Function that maps the shared stopping time table of a record search
+    worker, and gives it an empty LRU cache.
+
+    Args:
+        - table_path (string): Path of a table built by collatzTable.
+    """
+
+    import numpy as np
+
+    global _search_table, _search_overflow
+
+    # the table is complete, so the walks only read it
+    _search_table = np.memmap(table_path, dtype=TABLE_DTYPE, mode="r")
+    _search_overflow = OrderedDict()
+
+def _collatzRecordSearchShard(bounds: tuple[int, int]) -> dict:
+    """
+    Function that finds the stopping time records inside one shard.
+
+    Args:
+        - bounds (tuple[int, int]): The [start, end) range of the shard.
+
+    Returns:
+        - dictionary: The records of the shard, as start value and
+        stopping time pairs, and the timing stats of the shard.
+    """
+
+    (start, end) = bounds
+    started = time.perf_counter()
+
+    records = []
+    best_steps = -1
+
+    for n in range(start, end):
+        steps = _collatzCachedStoppingTime(n, _search_table, _search_overflow, DEFAULT_OVERFLOW_CACHE_SIZE)
+
+        if steps > best_steps:
+            records.append((n, steps))
+            best_steps = steps
+
+    seconds = time.perf_counter() - started
+
+    return {
+        "records": records,
+        "stats": {
+            "start": start,
+            "end": end,
+            "seconds": seconds,
+            "numbers_per_second": (end - start) / seconds if seconds > 0 else 0.0,
+        },
+    }
+
+def _collatzSaveCheckpoint(checkpoint_path: str, checkpoint: dict) -> None:
+    """
+    Function that saves the record search checkpoint, writing to a
+    temporary file first, so a killed process never leaves half a file.
+
+    Args:
+        - checkpoint_path (string): Path of the checkpoint file.
+        - checkpoint (dictionary): State of the search to save.
+
+    Side Effects:
+        - Writes the checkpoint file.
+    """
+
+    temporary_path = f"{checkpoint_path}.tmp"
+
+    with open(temporary_path, "w", encoding="utf-8") as file:
+        json.dump(checkpoint, file)
+
+    os.replace(temporary_path, checkpoint_path)
+
+# jump tables built so far, keyed by the number of bits k,
+# built once and shared across calls
+_jump_tables = {}
+
+def collatzJumpStoppingTime(n: int, k: int = DEFAULT_JUMP_BITS) -> int:
+    """
+    Function that finds the stopping time of n, advancing up to k
+    parity steps with one table lookup and multiply-add
+
+    Writing n = a * 2^k + b, where b is the low k bits of n, the first k
+    steps of the map n -> n / 2 (even) or n -> (3n + 1) / 2 (odd) only
+    depend on b, and take n to 3^c * a + d, where c is the number of odd
+    steps and d is the result of the same k steps from b. Each odd step
+    is two steps of the Collatz sequence, so one lookup advances k + c
+    steps. Once n is below 2^k, the remaining stopping time is looked
+    up directly, so the result matches the step by step sequence.
+
+    Args:
+        - n (integer): Positive integer to find the stopping time of.
+        - k (integer): Number of low bits the tables are indexed by,
+        between 1 and 20, the tables have 2^k entries.
+
+    Returns:
+        - integer: The stopping time of n. If a number lower than 1,
+        or a k out of range is supplied, -1 is returned.
+
+    Side Effects:
+        - Prints an error message if a number lower than 1, or a k
+        out of range is supplied.
+        - Builds the tables for k on the first call that uses it.
+    """
+
+    if n < 1:
+        print(f"Err: The number supplied was lower than one ({n}).")
+        return -1
+
+    if k < MIN_JUMP_BITS or k > MAX_JUMP_BITS:
+        print(f"Err: The number of jump bits must be between {MIN_JUMP_BITS} and {MAX_JUMP_BITS} ({k}).")
+        return -1
+
+    (multipliers, addends, jump_steps, stopping_times) = _collatzJumpTables(k)
+    mask = (1 << k) - 1
+    steps = 0
+
+    # jump while the high bits a are at least 1, the sequence
+    # cannot reach 1 part way through a jump in that case
+    while n > mask:
+        low = n & mask
+        n = multipliers[low] * (n >> k) + addends[low]
+        steps += jump_steps[low]
+
+    return steps + stopping_times[n]
+
+def _collatzJumpTables(k: int) -> tuple[list[int], list[int], list[int], list[int]]:
+    """
+    Function that returns the jump tables for k bits, building them
+    with vectorised updates if they do not exist yet.
+
+    Args:
+        - k (integer): Number of low bits the tables are indexed by,
+        between MIN_JUMP_BITS and MAX_JUMP_BITS.
+
+    Returns:
+        - tuple[list[int], list[int], list[int], list[int]]: For each
+        low bits value b, the multiplier 3^c, the addend d, and the
+        number of Collatz steps k + c of a jump, then the stopping
+        time of each value below 2^k.
+    """
+
+    import numpy as np
+
+    if k in _jump_tables:
+        return _jump_tables[k]
+
+    # run k steps of the shortcut map from every low bits value at once
+    values = np.arange(1 << k, dtype=np.int64)
+    odd_steps = np.zeros(1 << k, dtype=np.int64)
+
+    for _ in range(k):
+        odd = (values & 1) == 1
+        values = np.where(odd, (3 * values + 1) >> 1, values >> 1)
+        odd_steps += odd
+
+    # stopping times of the values below 2^k
+    stopping_times = array("H", [0]) * (1 << k)
+    overflow = OrderedDict()
+    for n in range(1, 1 << k):
+        _collatzCachedStoppingTime(n, stopping_times, overflow, 0)
+
+    # Python lists, as indexing them is much faster than NumPy scalars
+    _jump_tables[k] = (
+        (3 ** odd_steps).tolist(),
+        values.tolist(),
+        (k + odd_steps).tolist(),
+        stopping_times.tolist(),
+    )
+
+    return _jump_tables[k]
+
+def collatzJumpBenchmark(limit: int, k: int = DEFAULT_JUMP_BITS) -> dict:
+    """
+    Function that times the jump table stopping times against the step
+    by step version for every start value from 1 to limit, and checks
+    that both give the same results.
+
+    Args:
+        - limit (integer): Positive integer, the last start value to time.
+        - k (integer): Number of low bits the jump tables are indexed by,
+        between 1 and 20.
+
+    Returns:
+        - dictionary: The seconds taken to build the tables, the seconds
+        taken by the step by step and jump versions, and the speedup of
+        the jump version. If a number lower than 1, or a k out of range
+        is supplied, an empty dictionary is returned.
+
+    Side Effects:
+        - Prints the timings to the console.
+        - Prints an error message if a number lower than 1, or a k
+        out of range is supplied.
+    """
+
+    if limit < 1:
+        print(f"Err: The number supplied was lower than one ({limit}).")
+        return {}
+
+    if k < MIN_JUMP_BITS or k > MAX_JUMP_BITS:
+        print(f"Err: The number of jump bits must be between {MIN_JUMP_BITS} and {MAX_JUMP_BITS} ({k}).")
+        return {}
+
+    started = time.perf_counter()
+    _collatzJumpTables(k)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    step_results = [collatzStepCount(n) for n in range(1, limit + 1)]
+    step_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    jump_results = [collatzJumpStoppingTime(n, k) for n in range(1, limit + 1)]
+    jump_seconds = time.perf_counter() - started
+
+    if jump_results != step_results:
+        raise AssertionError("The jump table stopping times do not match the step by step version.")
+
+    speedup = step_seconds / jump_seconds if jump_seconds > 0 else 0.0
+
+    print(f"Built the k={k} jump tables in {build_seconds:.3f}s.")
+    print(f"Step by step: {step_seconds:.3f}s, jump tables: {jump_seconds:.3f}s, speedup: {speedup:.2f}x.")
+
+    return {
+        "build_seconds": build_seconds,
+        "step_seconds": step_seconds,
+        "jump_seconds": jump_seconds,
+        "speedup": speedup,
+    }
+
+def collatzTrajectory(n: int, stride: int = 1, stop_when: Callable[[int], bool] | None = None) -> Iterator[int]:
+    """
+    Generator that lazily yields the values of the Collatz sequence
+    starting from n, without printing or buffering the trajectory
+
+    Args:
+        - n (integer): Positive integer used as the start value.
+        - stride (integer): Positive integer, only every stride-th
+        value is yielded. The start value and the final value are
+        always yielded.
+        - stop_when (function): Optional predicate called with each
+        value after the start value, the sequence stops at the first
+        value it returns True for, i.e. lambda m: m < n.
+
+    Yields:
+        - integer: The values of the sequence, ending with 1 or the
+        value stop_when returned True for.
+
+    Side Effects:
+        - Prints an error message if a number lower than 1, or a stride
+        lower than 1, is supplied.
+    """
+
+    if n < 1 or stride < 1:
+        print(f"Err: The number supplied was lower than one ({min(n, stride)}).")
+        return
+
+    yield n
+
+    steps = 0
+
+    while n != 1:
+        n = n >> 1 if n & 1 == 0 else 3 * n + 1
+        steps += 1
+
+        # the final value is always yielded, sampled or not
+        if n == 1 or (stop_when is not None and stop_when(n)):
+            yield n
+            return
+
+        if steps % stride == 0:
+            yield n
+
+def collatzStepCount(n: int) -> int:
+    """
+    Iterative function that counts the steps of the Collatz sequence
+    from n down to 1, without printing
+
+    Args:
+        - n (integer): Positive integer used as the start value.
+
+    Returns:
+        - integer: The number of steps taken to reach 1. If a number
+        lower than 1 is supplied, -1 is returned.
+
+    Side Effects:
+        - Prints an error message if a number lower than 1 is supplied.
+    """
+
+    if n < 1:
+        print(f"Err: The number supplied was lower than one ({n}).")
+        return -1
+
+    steps = 0
+
+    while n != 1:
+        n = n >> 1 if n & 1 == 0 else 3 * n + 1
+        steps += 1
+
+    return steps
+
+def collatzBigInt(n: int) -> tuple[int, int]:
+    """
+    Function that runs the Collatz sequence for very large integers,
+    without building the trajectory in memory
+
+    Instead of halving one step at a time, all of the trailing zero
+    bits of n are removed with one shift, counting one step for each
+    bit. The odd steps are fused with the halving that always follows
+    them, computing (3n + 1) / 2 as n + (n >> 1) + 1, so each bigint
+    operation covers as many steps as possible.
+
+    Args:
+        - n (integer): Positive integer used as the start value.
+
+    Returns:
+        - tuple[int, int]: The stopping time of n, and the bit length
+        of the largest value in the trajectory. If a number lower than
+        1 is supplied, (-1, -1) is returned.
+
+    Side Effects:
+        - Prints an error message if a number lower than 1 is supplied.
+    """
+
+    if n < 1:
+        print(f"Err: The number supplied was lower than one ({n}).")
+        return (-1, -1)
+
+    peak_bits = n.bit_length()
+
+    # remove the trailing zero bits of the start value
+    zeros = (n & -n).bit_length() - 1
+    n >>= zeros
+    steps = zeros
+
+    while n != 1:
+        # n is odd here, so 3n + 1 is even and is halved straight
+        # away, (3n + 1) / 2 is one bit shorter than the peak 3n + 1
+        n = n + (n >> 1) + 1
+        steps += 2
+        if n.bit_length() + 1 > peak_bits:
+            peak_bits = n.bit_length() + 1
+
+        # remove the remaining trailing zero bits in one shift
+        zeros = (n & -n).bit_length() - 1
+        n >>= zeros
+        steps += zeros
+
+    return (steps, peak_bits)
+
+def collatzTable(path: str, limit: int) -> np.memmap:
+    """
+    Function that returns a read only memory-mapped table of the
+    stopping times of every value from 0 to at least limit
+
+    The table is a flat file of little endian 16 bit integers, where
+    entry n is the stopping time of n (entry 0 is unused). It is
+    computed once and reused by later runs. If the file does not cover
+    limit yet, only the missing entries are computed and appended.
+    Every process that maps the file shares the same pages through the
+    operating system, so workers do not load their own copy. Only one
+    process should grow a table at a time.
+
+    Args:
+        - path (string): Path of the table file.
+        - limit (integer): Positive integer, the last value the table
+        must cover.
+
+    Returns:
+        - np.memmap: Read only array of the stopping times, indexed by
+        start value. It can be longer than limit + 1, if an earlier run
+        requested a larger limit.
+
+    Side Effects:
+        - Creates or appends to the table file.
+    """
+
+    import numpy as np
+
+    limit = max(limit, 1)
+
+    # number of entries already on disk, ignoring a half
+    # written entry from an interrupted run
+    itemsize = np.dtype(TABLE_DTYPE).itemsize
+    existing = os.path.getsize(path) // itemsize if os.path.exists(path) else 0
+
+    if existing < limit + 1:
+        # load the existing entries to continue from them
+        table = array("H")
+        if existing:
+            table.frombytes(np.fromfile(path, dtype=TABLE_DTYPE, count=existing).astype(np.uint16).tobytes())
+        table.extend(array("H", [0]) * (limit + 1 - existing))
+
+        # compute the missing entries, the walks stop at known values
+        overflow = OrderedDict()
+        for n in range(max(existing, 1), limit + 1):
+            _collatzCachedStoppingTime(n, table, overflow, 0)
+
+        with open(path, "r+b" if existing else "wb") as file:
+            # drop a half written entry, then append the new ones
+            file.truncate(existing * itemsize)
+            file.seek(existing * itemsize)
+            file.write(np.frombuffer(table, dtype=np.uint16)[existing:].astype(TABLE_DTYPE).tobytes())
+
+    return np.memmap(path, dtype=TABLE_DTYPE, mode="r")
+
+def collatzTableLookup(table: np.ndarray, n: int) -> int:
+    """
+    Function that returns the stopping time of n, reading it from a
+    stopping time table in O(1) when n is covered, and otherwise walking
+    the sequence until it reaches a value the table covers.
+
+    Args:
+        - table (np.ndarray): Stopping time table, i.e. from collatzTable.
+        - n (integer): Positive integer to find the stopping time of.
+
+    Returns:
+        - integer: The stopping time of n. If a number lower than 1
+        is supplied, -1 is returned.
+
+    Side Effects:
+        - Prints an error message if a number lower than 1 is supplied.
+    """
+
+    if n < 1:
+        print(f"Err: The number supplied was lower than one ({n}).")
+        return -1
+
+    steps = 0
+    size = len(table)
+
+    while n >= size:
+        n = n >> 1 if n & 1 == 0 else 3 * n + 1
+        steps += 1
+
+    return steps + int(table[n])
+
+def main() -> None:
+    """
+    Function that runs the collatz function for a few test values,
+    used when the file is run as a script.
+
+    Side Effects:
+        - Prints the output of the collatz function to the console.
+    """
+
+    # test code is working
+    for n in range(-1, 6):
+        print(f"Starting collatz function with n={n}: ")
+        collatz(n)
+
+if __name__ == "__main__":
+    main()
@@ -3,129 +3,1790 @@ find_most_frequent.py
 
 Author: Liam Mills
 Created: 2025-10-16
-Last Modified: 2025-10-30
+Last Modified: 2026-10-17
 
 Implements functions that find the most frequent words from arrays based on various criteria, and
 other functions to support them.
 
 Functions:
-    - findMostFrequentWord(inputList1: list[str], inputList2: list[str]) -> str: Returns a string of the most
-    frequent word in inputList1 that does not appear in inputList2.
-    - findMostFrequentFollower(inputList: list[str], targetWord: str) -> str: Returns a string of the most
-    frequent following word of the targetWord, based on the inputList of strings.
+    - findMostFrequentWord(inputList1: list[str] | EncodedText, inputList2: list[str] | ExclusionIndex | EncodedText) -> str: Returns a
+    string of the most frequent word in inputList1 that does not appear in inputList2.
+    - findMostFrequentWordStream(source: str | os.PathLike | Iterable[str], exclusions: Iterable[str] | ExclusionIndex = (), chunk_size: int = 1 << 20,
+    items_end_words: bool = False) -> str: Returns a string of the most frequent word in a file or iterable of text chunks
+    that does not appear in exclusions, counting the words as the chunks arrive.
+    - findMostFrequentWordParallel(paths: list[str | os.PathLike], exclusions: Iterable[str] | ExclusionIndex = (), processes: int | None = None,
+    chunk_bytes: int = 1 << 24) -> str: Returns a string of the most frequent word in a set of files that does not appear in
+    exclusions, counting byte ranges of the files on a process pool.
+    - findMostFrequentWordMmap(paths: str | os.PathLike | list[str | os.PathLike], exclusions: Iterable[str] | ExclusionIndex = (),
+    chunk_bytes: int = 1 << 24) -> str: Returns a string of the most frequent word in a set of files that does not appear in
+    exclusions, memory mapping the files and counting their words as bytes.
+    - findMostFrequentFollower(inputList: list[str] | FollowerIndex | NgramTrie | EncodedText, targetWord: str) -> str: Returns a
+    string of the most frequent following word of the targetWord, which can be several words, based on the inputList of strings.
+    - findMostFrequentWordApproximate(source: str | os.PathLike | Iterable[str], exclusions: Iterable[str] | ExclusionIndex = (),
+    method: str = "space-saving", capacity: int = 1000, epsilon: float = 0.001, delta: float = 0.01, items_end_words: bool = False) -> tuple[str, int, int]:
+    Returns an approximation of the most frequent word in a file or iterable of text chunks in fixed memory, with its
+    estimated count and the most the estimate can be over by.
+    - findMostFrequentFollowerApproximate(source: str | os.PathLike | Iterable[str], targetWord: str, method: str = "space-saving",
+    capacity: int = 1000, epsilon: float = 0.001, delta: float = 0.01, items_end_words: bool = False) -> tuple[str, int, int]: Returns an approximation
+    of the most frequent following word of the targetWord in fixed memory, with its estimated count and error bound.
     - findMaxValueFromDictionaryOfNumbers(dictionary: dict, target: str = "first") -> str: Returns a string of the key of the item in a dictionary with the highest value.
+    - findTopValuesFromDictionaryOfNumbers(dictionary: dict | np.ndarray, k: int, target: str = "first") -> list: Returns the
+    keys of the k items with the highest values, from a dictionary or a NumPy array of counts, with a bounded heap.
     - removePunctuationFromString(string: str) -> str: Function to remove all punctuation from a string.
+    - tokenizeString(string: str, lowercase: bool = False, unicode_punctuation: bool = False) -> Iterator[str]: Lazily
+    yields the words of a string, removing punctuation, lowercasing and splitting in one pass each.
     - findMostFrequentWordUserInteraction() -> str: Function for user interaction to run the findMostFrequentWord function.
     - findMostFrequentFollowerUserInteraction() -> str: Function for user interaction to run the findMostFrequentFollower function.
+    - main() -> None: Function that runs both user interaction functions, used when the file is run as a script.
+
+Dependencies:
+    - NumPy (imported on first use, only for counts stored in arrays and EncodedText)
+
+Classes:
+    - ExclusionIndex: Normalised set of words to exclude, built once and reused across calls, with hashed membership
+    checks, saving and loading, and an optional Bloom filter for very large lists.
+    - FollowerIndex: Index of the words that follow each word, built in one pass, that answers repeated
+    findMostFrequentFollower queries over the same text in O(1).
+    - NgramTrie: Trie of the n-grams of a text up to a maximum n, built in one pass, that answers the most frequent
+    follower of any prefix of up to n - 1 words in O(prefix length).
+    - SpaceSavingCounter: Space-Saving heavy hitter counter, which counts at most capacity words.
+    - CountMinSketch: Count-Min sketch of word counts in fixed memory, which keeps track of its heaviest word.
+    - Vocabulary: Interned vocabulary that maps each word to a dense integer ID.
+    - EncodedText: Text stored as an array of word IDs, which the word functions accept in place of a list of strings,
+    and count with NumPy.
+    - SlidingWindowCounter: Counts of the words in the last N words or T seconds of a live stream, which keeps track
+    of the most frequent word as words arrive and expire.
 """
 
-def findMostFrequentWord(inputList1: list[str], inputList2: list[str]) -> str:
+from __future__ import annotations
+
+import base64
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import random
+import re
+import sys
+import time
+import unicodedata
+from array import array
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from functools import cache
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# CONSTANTS
+# list of all punctuation
+PUNCTUATION = ["!", "\"", "#", "$", "%", "&", "'", "(", ")", "*", "+", ",", "-", ".", "/", ":", ";", "<", "=", ">", "?", "@", "[", "\\", "]", "^", "_", "`", "{", "|", "}", "~"]
+
+# translation table that deletes all punctuation in one pass
+PUNCTUATION_TABLE = str.maketrans("", "", "".join(PUNCTUATION))
+
+# a word is any run of characters that are not whitespace
+WORD_PATTERN = re.compile(r"\S+")
+
+# runs of two or more spaces
+SPACES_PATTERN = re.compile(r" {2,}")
+
+# default number of characters read from a file at a time when streaming
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# default number of bytes of a file counted by each worker task
+DEFAULT_PARALLEL_CHUNK_BYTES = 1 << 24
+
+# ASCII whitespace, the byte ranges of a file are split just after one of these,
+# so a word is never split between two workers
+WHITESPACE_BYTES = b" \t\n\r\x0b\x0c"
+
+# all punctuation as bytes, deleted by bytes.translate
+PUNCTUATION_BYTES = "".join(PUNCTUATION).encode("ascii")
+
+# bytes translation table that turns the ASCII separators str.split
+# splits on, but bytes.split does not, into spaces
+PUNCTUATION_BYTES_TABLE = bytes.maketrans(b"\x1c\x1d\x1e\x1f", b"    ")
+
+# whitespace bytes, including the ASCII separators, the mapped files are split
+# just after one of these, so a word is never split between two chunks
+WHITESPACE_BYTES_PATTERN = re.compile(rb"[ \t\n\r\x0b\x0c\x1c-\x1f]")
+
+# number of counts in an array looked at a time when finding the top values,
+# so the memory used does not grow with the size of the array
+TOP_VALUES_CHUNK_SIZE = 1 << 20
+
+def findMostFrequentWord(inputList1: list[str] | EncodedText, inputList2: list[str] | ExclusionIndex | EncodedText) -> str:
     """
     Function to find the most frequent word in an array, which was the result
     of subtracting the overlapping elements from array inputList2 from 
     array inputList1
 
     Args:
-        - inputList1 (list of strings): List of strings.
-        - inputList2 (list of strings): List of strings.
+        - inputList1 (list of strings or EncodedText): List of strings, or
+        the same text encoded as word IDs, which is counted with NumPy.
+        - inputList2 (list of strings, ExclusionIndex or EncodedText): List
+        of strings, or an ExclusionIndex built from them, to reuse across
+        calls, or the same list encoded as word IDs.
+
+    Returns:
+        - string: The word with the highest frequency count, or if
+        an error occurs, the string of "-1" is returned. If there are
+        multiple words with the same count, then the first word with
+        that count will be returned.
+
+    Side Effects:
+        - Prints error messages to the console.
+    """
+
+    # if input arrays don't contain values, return error code
+    if len(inputList1) == 0 or len(inputList2) == 0:
+        print("Err: one or more of the parameters were empty.")
+        return "-1"
+    
+    # build an index for hashed membership checks,
+    # unless one was passed in already built
+    if isinstance(inputList2, EncodedText):
+        inputList2 = ExclusionIndex(inputList2.words())
+    elif not isinstance(inputList2, ExclusionIndex):
+        inputList2 = ExclusionIndex(inputList2)
+
+    # the encoded text is already tokenized, and is counted by ID
+    if isinstance(inputList1, EncodedText):
+        return inputList1.mostFrequentWord(inputList2)
+
+    # remove punctuation from user inputs
+    inputList1 = tokenizeString(" ".join(inputList1))
+
+    # create dicionary for count of each string
+    string_count = {}
+
+    # create a list by subtracking all items of inputList2 from inputList1
+    subtracted_arr = [item for item in inputList1 if item not in inputList2]
+
+    # if dictionary size is zero, return error code
+    if len(subtracted_arr) == 0:
+        print("Err: the resulting array was empty, inputList1 did not contain any differentiating strings.")
+        return "-1"
+
+    # loop the subtracted array to add count per word
+    for str in subtracted_arr:
+        if str in string_count:
+            string_count[str] += 1
+        else:
+            string_count[str] = 1
+
+    # if dictionary size is zero, return error code
+    if len(string_count.keys()) == 0:
+        print("Err: the resulting dictionary was empty.")
+        return "-1"
+
+    # find largest value in dictionary & return its key
+    # or return the first if there are tying words
+    return findMaxValueFromDictionaryOfNumbers(string_count)
+
+def findMostFrequentWordStream(source: str | os.PathLike | Iterable[str], exclusions: Iterable[str] | ExclusionIndex = (), chunk_size: int = DEFAULT_CHUNK_SIZE, items_end_words: bool = False) -> str:
+    """
+    Function to find the most frequent word in a file, or an iterable of
+    lines or chunks of text, that does not appear in exclusions
+
+    The text is never joined together. Each chunk has its punctuation
+    removed and is split into words as it arrives, and the words are
+    counted straight away, so the memory used is bounded by the number
+    of distinct words rather than the size of the text. A word that is
+    split across two chunks is held back and joined to the start of
+    the next chunk, unless items_end_words is set, for lines that have
+    had their new lines stripped. Words are split on any whitespace,
+    including new lines, and the same tie-break as findMostFrequentWord
+    is used.
+
+    Args:
+        - source (string, path or iterable of strings): Path of a UTF-8
+        text file, or an iterable of lines or chunks of text.
+        - exclusions (iterable of strings or ExclusionIndex): Words to
+        leave out of the count.
+        - chunk_size (integer): Number of characters to read from a file
+        at a time.
+        - items_end_words (bool): Whether each item of an iterable ends
+        a word, i.e. lines without their new lines.
+
+    Returns:
+        - string: The word with the highest frequency count, or if
+        an error occurs, the string of "-1" is returned. If there are
+        multiple words with the same count, then the first word with
+        that count will be returned.
+
+    Side Effects:
+        - Prints error messages to the console.
+    """
+
+    # normalise the exclusions the same way as the text
+    if not isinstance(exclusions, ExclusionIndex):
+        exclusions = ExclusionIndex(exclusions)
+
+    # create dicionary for count of each string
+    string_count = {}
+
+    for word in _streamWords(source, chunk_size, items_end_words):
+        if word not in exclusions:
+            string_count[word] = string_count.get(word, 0) + 1
+
+    # if dictionary size is zero, return error code
+    if len(string_count) == 0:
+        print("Err: the source did not contain any words that were not excluded.")
+        return "-1"
+
+    # find largest value in dictionary & return its key
+    # or return the first if there are tying words
+    return findMaxValueFromDictionaryOfNumbers(string_count)
+
+def _streamWords(source: str | os.PathLike | Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE, items_end_words: bool = False) -> Iterator[str]:
+    """
+    Generator that yields the words of a file or iterable of text chunks,
+    with punctuation removed, one chunk at a time.
+
+    Args:
+        - source (string, path, iterable of strings or EncodedText): Path
+        of a UTF-8 text file, an iterable of lines or chunks of text, or
+        text encoded as word IDs, which is decoded a word at a time.
+        - chunk_size (integer): Number of characters to read from a file
+        at a time.
+        - items_end_words (bool): Whether each item of an iterable ends
+        a word, instead of a word carrying on into the next item.
+
+    Yields:
+        - string: Each word of the text, in order.
+    """
+
+    # already tokenized, so the words only need decoding
+    if isinstance(source, EncodedText):
+        words = source.vocabulary.words
+        for word_id in source.ids.tolist():
+            yield words[word_id]
+        return
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "r", encoding="utf-8") as file:
+            yield from _streamChunkWords(iter(lambda: file.read(chunk_size), ""))
+        return
+
+    if not items_end_words:
+        yield from _streamChunkWords(source)
+        return
+
+    # each item ends a word, so nothing carries between them
+    for chunk in source:
+        yield from chunk.translate(PUNCTUATION_TABLE).split()
+
+def _streamChunkWords(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Generator that yields the words of consecutive chunks of one text,
+    joining up words that are split across the edge of two chunks.
+
+    Args:
+        - chunks (iterable of strings): Consecutive chunks of one text.
+
+    Yields:
+        - string: Each word of the text, in order.
+    """
+
+    # part of a word at the end of the last chunk, waiting for the rest
+    carry = ""
+
+    for chunk in chunks:
+        # punctuation is removed before splitting, the same as the other
+        # functions, so a word split at a punctuation mark still joins up
+        text = carry + chunk.translate(PUNCTUATION_TABLE)
+        words = text.split()
+
+        # hold back the last word if the chunk ends part way through it
+        if words and not text[-1].isspace():
+            carry = words.pop()
+        else:
+            carry = ""
+
+        yield from words
+
+    if carry:
+        yield carry
+
+def findMostFrequentWordParallel(paths: list[str | os.PathLike], exclusions: Iterable[str] | ExclusionIndex = (), processes: int | None = None, chunk_bytes: int = DEFAULT_PARALLEL_CHUNK_BYTES) -> str:
+    """
+    Function to find the most frequent word in a set of UTF-8 text files,
+    that does not appear in exclusions, counting on a process pool
+
+    The files are split into byte ranges of about chunk_bytes, each ending
+    just after a whitespace byte, so no word is split between two ranges.
+    Each worker tokenizes and counts its range, leaving out the excluded
+    words before sending its counts back, and the counts are merged in a
+    tree of pairwise merges. Every merge keeps the order the words were
+    first seen in, so the result and tie-break are the same as passing
+    the files one after the other to findMostFrequentWordStream.
+
+    Args:
+        - paths (list of strings or paths): Paths of the files to count.
+        - exclusions (iterable of strings or ExclusionIndex): Words to
+        leave out of the count.
+        - processes (integer): Number of worker processes, defaults to
+        the number of CPUs.
+        - chunk_bytes (integer): Approximate number of bytes in each range.
+
+    Returns:
+        - string: The word with the highest frequency count, or if
+        an error occurs, the string of "-1" is returned. If there are
+        multiple words with the same count, then the first word with
+        that count will be returned.
+
+    Side Effects:
+        - Prints error messages to the console.
+    """
+
+    import multiprocessing
+
+    if not isinstance(exclusions, ExclusionIndex):
+        exclusions = ExclusionIndex(exclusions)
+
+    # byte ranges of every file, in order
+    ranges = [byte_range for path in paths for byte_range in _splitFileIntoByteRanges(path, max(1, chunk_bytes))]
+
+    if len(ranges) == 0:
+        print("Err: the files did not contain any words that were not excluded.")
+        return "-1"
+
+    # map, count each byte range on the pool, the results stay in order
+    with multiprocessing.Pool(processes, initializer=_countWordsInit, initargs=(exclusions,)) as pool:
+        partial_counts = pool.map(_countWordsInByteRange, ranges)
+
+    # reduce, merge neighbouring counts in pairs until one is left,
+    # the left counts always come first, so the order is kept
+    while len(partial_counts) > 1:
+        merged = [_mergeWordCounts(partial_counts[index], partial_counts[index + 1]) for index in range(0, len(partial_counts) - 1, 2)]
+
+        if len(partial_counts) % 2 == 1:
+            merged.append(partial_counts[-1])
+
+        partial_counts = merged
+
+    string_count = partial_counts[0]
+
+    # if dictionary size is zero, return error code
+    if len(string_count) == 0:
+        print("Err: the files did not contain any words that were not excluded.")
+        return "-1"
+
+    # find largest value in dictionary & return its key
+    # or return the first if there are tying words
+    return findMaxValueFromDictionaryOfNumbers(string_count)
+
+def _splitFileIntoByteRanges(path: str | os.PathLike, chunk_bytes: int) -> list[tuple[str | os.PathLike, int, int]]:
+    """
+    Function that splits a file into byte ranges of about chunk_bytes,
+    moving the end of each range forward to just after a whitespace byte.
+
+    Args:
+        - path (string or path): Path of the file.
+        - chunk_bytes (integer): Approximate number of bytes in each range.
+
+    Returns:
+        - list[tuple[string or path, int, int]]: The path, start and end
+        of each range.
+    """
+
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+
+    with open(path, "rb") as file:
+        while start < size:
+            end = min(start + chunk_bytes, size)
+
+            # read forward until a whitespace byte, or the end of the file
+            file.seek(end)
+            while end < size:
+                block = file.read(4096)
+                positions = [position for position in (block.find(byte) for byte in WHITESPACE_BYTES) if position != -1]
+
+                if positions:
+                    end += min(positions) + 1
+                    break
+
+                end += len(block)
+
+            ranges.append((path, start, end))
+            start = end
+
+    return ranges
+
+# exclusions of each word counting worker process
+_count_exclusions = None
+
+def _countWordsInit(exclusions: ExclusionIndex) -> None:
+    """
+    Function that stores the exclusions in a word counting worker, so
+    they are only sent to each worker once.
+
+    Args:
+        - exclusions (ExclusionIndex): Words to leave out of the count.
+    """
+
+    global _count_exclusions
+
+    _count_exclusions = exclusions
+
+def _countWordsInByteRange(byte_range: tuple[str | os.PathLike, int, int]) -> dict[str, int]:
+    """
+    Function that counts the words in a byte range of a file, leaving
+    out the excluded words.
+
+    Args:
+        - byte_range (tuple[string or path, int, int]): The path, start
+        and end of the range.
+
+    Returns:
+        - dict[str, int]: The count of each word, in the order the words
+        were first seen in.
+    """
+
+    (path, start, end) = byte_range
+
+    with open(path, "rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode("utf-8")
+
+    string_count = {}
+
+    for word in text.translate(PUNCTUATION_TABLE).split():
+        if word not in _count_exclusions:
+            string_count[word] = string_count.get(word, 0) + 1
+
+    return string_count
+
+def _mergeWordCounts(left: dict[str, int], right: dict[str, int]) -> dict[str, int]:
+    """
+    Function that adds the counts of right into left, the words first
+    seen in right are added after the words of left.
+
+    Args:
+        - left (dict[str, int]): Counts of the earlier text, updated in place.
+        - right (dict[str, int]): Counts of the later text.
+
+    Returns:
+        - dict[str, int]: The merged counts, which is left.
+    """
+
+    for (word, count) in right.items():
+        left[word] = left.get(word, 0) + count
+
+    return left
+
+def findMostFrequentWordMmap(paths: str | os.PathLike | list[str | os.PathLike], exclusions: Iterable[str] | ExclusionIndex = (), chunk_bytes: int = DEFAULT_PARALLEL_CHUNK_BYTES) -> str:
+    """
+    Function to find the most frequent word in a set of UTF-8 text files,
+    that does not appear in exclusions, without decoding the files
+
+    Each file is memory mapped and tokenized a chunk of about chunk_bytes
+    at a time, on bytes, with bytes.translate and bytes.split, so only the
+    chunk being split is ever copied out of the map. The words are counted
+    as bytes. A chunk that is all ASCII splits the same as the decoded text
+    would, any other chunk only decodes the words holding non-ASCII bytes,
+    to split them on Unicode whitespace. The exclusions are only checked,
+    and the words only decoded, for the words that could be the answer.
+    The result and tie-break are the same as findMostFrequentWordStream.
+
+    Args:
+        - paths (string, path or list of strings or paths): Path or paths
+        of the files to count.
+        - exclusions (iterable of strings or ExclusionIndex): Words to
+        leave out of the count.
+        - chunk_bytes (integer): Approximate number of bytes tokenized at a time.
+
+    Returns:
+        - string: The word with the highest frequency count, or if
+        an error occurs, the string of "-1" is returned. If there are
+        multiple words with the same count, then the first word with
+        that count will be returned.
+
+    Side Effects:
+        - Prints error messages to the console.
+    """
+
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+
+    if not isinstance(exclusions, ExclusionIndex):
+        exclusions = ExclusionIndex(exclusions)
+
+    # counts of each word, as bytes, in the order they were first seen in
+    byte_count = Counter()
+
+    for path in paths:
+        # an empty file cannot be mapped, and has no words anyway
+        if os.path.getsize(path) == 0:
+            continue
+
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            size = len(mapped)
+            start = 0
+
+            while start < size:
+                # move the end of the chunk to just after a whitespace byte
+                match = WHITESPACE_BYTES_PATTERN.search(mapped, min(start + max(1, chunk_bytes), size))
+                end = match.end() if match else size
+
+                byte_count.update(_splitBytes(mapped[start:end]))
+                start = end
+
+    # the first word with the highest count that is not excluded,
+    # a word is only decoded when it beats the best count so far
+    (best_word, best_count) = (None, 0)
+
+    for (word, count) in byte_count.items():
+        if count > best_count:
+            decoded = word.decode("utf-8")
+
+            if decoded not in exclusions:
+                (best_word, best_count) = (decoded, count)
+
+    # if every word was excluded, return error code
+    if best_word is None:
+        print("Err: the files did not contain any words that were not excluded.")
+        return "-1"
+
+    return best_word
+
+def _splitBytes(chunk: bytes) -> list[bytes]:
+    """
+    Function that removes the punctuation from a chunk of UTF-8 text and
+    splits it into words, without decoding the ASCII parts of it.
+
+    Args:
+        - chunk (bytes): The chunk of text, which does not start or end
+        part way through a word.
+
+    Returns:
+        - list[bytes]: The words of the chunk, in order.
+    """
+
+    # ASCII bytes are never part of a multi-byte character, so deleting
+    # the punctuation and splitting on ASCII whitespace is always safe
+    words = chunk.translate(PUNCTUATION_BYTES_TABLE, PUNCTUATION_BYTES).split()
+
+    # ASCII fast path, the words are already split the same as str.split
+    if chunk.isascii():
+        return words
+
+    # a non-ASCII word can still hold Unicode whitespace, such as a
+    # no-break space, so split those words again once decoded
+    split_words = []
+
+    for word in words:
+        if word.isascii():
+            split_words.append(word)
+        else:
+            split_words.extend(part.encode("utf-8") for part in word.decode("utf-8").split())
+
+    return split_words
+
+class ExclusionIndex:
+    """
+    Class that holds a set of words to exclude from the counts, normalised
+    once in the same way as the text they are checked against, so a large
+    stopword or block list can be built once and passed to every call
+
+    Membership checks are hashed, so they take O(1) time. For very large
+    lists, a Bloom filter can be used instead of a set, which uses a
+    fixed number of bits per word. A Bloom filter can report a word as
+    excluded when it is not (at the false_positive_rate), but never the
+    other way around.
+
+    Args:
+        - words (iterable of strings): Words to exclude.
+        - use_bloom (bool): Whether to store the words in a Bloom filter.
+        - false_positive_rate (float): Target false positive rate of the
+        Bloom filter, between 0 and 1.
+    """
+
+    def __init__(self, words: Iterable[str] = (), use_bloom: bool = False, false_positive_rate: float = 0.001) -> None:
+        # normalise the words the same way as findMostFrequentWord does
+        normalised = set(tokenizeString(" ".join(words)))
+
+        self.use_bloom = use_bloom
+        self.words = set()
+        self.count = len(normalised)
+
+        if not use_bloom:
+            self.words = normalised
+            return
+
+        if not 0 < false_positive_rate < 1:
+            raise ValueError(f"false_positive_rate must be between 0 and 1, not {false_positive_rate}.")
+
+        # optimal number of bits for the word count, rounded up to a power
+        # of two, so a hash can be masked to a position without bias, then
+        # the optimal number of hash functions for that many bits
+        bit_count = max(8, math.ceil(-max(1, self.count) * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.bit_count = 1 << (bit_count - 1).bit_length()
+        self.hash_count = max(1, round(self.bit_count / max(1, self.count) * math.log(2)))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+
+        for word in normalised:
+            for position in self._bitPositions(word):
+                self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, word: str) -> bool:
+        if not self.use_bloom:
+            return word in self.words
+
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._bitPositions(word))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _bitPositions(self, word: str) -> Iterator[int]:
+        """
+        Generator that yields the Bloom filter bit positions of a word,
+        each from its own 8 bytes of a stable hash, so the positions are
+        independent of each other, and a saved filter still matches in a
+        new process.
+
+        Args:
+            - word (string): Word to hash.
+
+        Yields:
+            - integer: hash_count bit positions.
+        """
+
+        data = word.encode("utf-8")
+        # bit_count is a power of two, so masking keeps every bit as likely
+        mask = self.bit_count - 1
+
+        # a 64 byte digest holds 8 positions, a new salt gives 8 more
+        for block in range(0, self.hash_count, 8):
+            digest = hashlib.blake2b(data, salt=block.to_bytes(16, "little")).digest()
+            for start in range(0, 8 * min(8, self.hash_count - block), 8):
+                yield int.from_bytes(digest[start:start + 8], "little") & mask
+
+    def save(self, path: str | os.PathLike) -> None:
+        """
+        Function that saves the index to a JSON file.
+
+        Args:
+            - path (string or path): Path of the file to write.
+
+        Side Effects:
+            - Writes the file.
+        """
+
+        if self.use_bloom:
+            data = {
+                "type": "bloom",
+                "count": self.count,
+                "bit_count": self.bit_count,
+                "hash_count": self.hash_count,
+                "bits": base64.b64encode(bytes(self.bits)).decode("ascii"),
+            }
+        else:
+            data = {
+                "type": "set",
+                "words": sorted(self.words),
+            }
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> ExclusionIndex:
+        """
+        Function that loads an index saved with save, without normalising
+        the words again.
+
+        Args:
+            - path (string or path): Path of the file to read.
+
+        Returns:
+            - ExclusionIndex: The loaded index.
+        """
+
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+
+        index = cls()
+
+        if data["type"] == "bloom":
+            index.use_bloom = True
+            index.count = data["count"]
+            index.bit_count = data["bit_count"]
+            index.hash_count = data["hash_count"]
+            index.bits = bytearray(base64.b64decode(data["bits"]))
+        else:
+            index.words = set(data["words"])
+            index.count = len(index.words)
+
+        return index
+
+def findMostFrequentFollower(inputList: list[str] | FollowerIndex | NgramTrie | EncodedText, targetWord: str) -> str:
+    """
+    Function to find the most frequent word in an array that follows
+    a target word, or a target run of words
+
+    Args:
+        - inputList1 (list of strings, FollowerIndex, NgramTrie or EncodedText):
+        List of strings, or a FollowerIndex or NgramTrie built from them, to
+        answer many target words without scanning the list again, or the
+        same text encoded as word IDs, which is counted with NumPy. Only
+        the list and NgramTrie take a target of more than one word.
+        - targetWord (string): String used as the target word of the
+        function, a target of several words is matched as a whole.
+
+    Returns:
+        - string: The word with the highest frequency count, or if
+        an error occurs, the string of "-1" is returned. If there are
+        multiple words with the same count, then the last word with
+        that count will be returned.
+
+    Side Effects:
+        - Prints error messages to the console.
+    """
+
+    # if inputs don't contain values, return error code
+    if len(inputList) == 0 or len(targetWord) == 0:
+        print("Err: one or more of the parameters were empty.")
+        return "-1" 
+
+    # the index already holds the counts of every target word
+    if isinstance(inputList, (FollowerIndex, NgramTrie)):
+        return inputList.mostFrequentFollower(targetWord)
+
+    if isinstance(inputList, EncodedText):
+        return inputList.mostFrequentFollower(targetWord)
+
+    # remove punctuation from user inputs, the words
+    # are lowercased as they are tokenized
+    words = tokenizeString(" ".join(inputList), lowercase=True)
+    target = tuple(tokenizeString(targetWord, lowercase=True))
+
+    # create dicionary for count of each string
+    string_count = {}
+
+    # the words before the current one, as many as the target has
+    previous = deque(maxlen=max(1, len(target)))
+
+    for str in words:
+        # if the previous words equal the target words,
+        # the current word follows them
+        if target and previous and previous[-1] == target[-1] and tuple(previous) == target:
+            # up the count of the word in the string_count dictionary
+            if str in string_count:
+                string_count[str] += 1
+            else:
+                string_count[str] = 1
+
+        previous.append(str)
+
+    # find largest value in dictionary & return its key
+    # or return the last word if there are tying words
+    return findMaxValueFromDictionaryOfNumbers(string_count, "last")
+
+class FollowerIndex:
+    """
+    Class that indexes the words that follow each word in a text, built
+    in one pass, so the most frequent follower of any target word can be
+    looked up in O(1) instead of scanning the text for every query
+
+    Words are lowercased and have their punctuation removed, the same as
+    findMostFrequentFollower, and ties give the same "last" word. More
+    text can be added at any time, and the index can be saved to and
+    loaded from a JSON file.
+
+    Args:
+        - inputList (list of strings): Text to index, can be empty.
+    """
+
+    def __init__(self, inputList: Iterable[str] = ()) -> None:
+        # follower counts of each word
+        self.followers = {}
+
+        # last word added, which the next text added follows
+        self.last_word = None
+
+        self.add(inputList)
+
+    def __len__(self) -> int:
+        return len(self.followers)
+
+    def add(self, inputList: Iterable[str] | str, continue_text: bool = True) -> None:
+        """
+        Function that adds more text to the index.
+
+        Args:
+            - inputList (list of strings or string): Text to add.
+            - continue_text (bool): Whether the text carries on from the
+            text added before, so its first word follows the last word
+            added before, or is a separate document.
+        """
+
+        if not isinstance(inputList, str):
+            inputList = " ".join(inputList)
+
+        previous = self.last_word if continue_text else None
+
+        for word in tokenizeString(inputList, lowercase=True):
+            if previous is not None:
+                counts = self.followers.get(previous)
+                if counts is None:
+                    counts = self.followers[previous] = _FollowerCounts()
+                counts.increment(word)
+
+            previous = word
+
+        if previous is not None:
+            self.last_word = previous
+
+    def mostFrequentFollower(self, targetWord: str) -> str:
+        """
+        Function that returns the most frequent follower of targetWord.
+
+        Args:
+            - targetWord (string): String used as the target word.
+
+        Returns:
+            - string: The word with the highest frequency count, or if
+            an error occurs, the string of "-1" is returned. If there are
+            multiple words with the same count, then the last word with
+            that count will be returned.
+
+        Side Effects:
+            - Prints error messages to the console.
+        """
+
+        counts = self.followers.get(" ".join(tokenizeString(targetWord, lowercase=True)))
+
+        # if the target word has no followers, return error code
+        if counts is None:
+            print("Err: the resulting dictionary was empty.")
+            return "-1"
+
+        return counts.best
+
+    def save(self, path: str | os.PathLike) -> None:
+        """
+        Function that saves the index to a JSON file, keeping the order
+        the followers were first seen in, which the tie-break needs.
+
+        Args:
+            - path (string or path): Path of the file to write.
+
+        Side Effects:
+            - Writes the file.
+        """
+
+        data = {
+            "last_word": self.last_word,
+            "followers": {word: counts.counts for (word, counts) in self.followers.items()},
+        }
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> FollowerIndex:
+        """
+        Function that loads an index saved with save.
+
+        Args:
+            - path (string or path): Path of the file to read.
+
+        Returns:
+            - FollowerIndex: The loaded index.
+        """
+
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+
+        index = cls()
+        index.last_word = data["last_word"]
+
+        for (word, saved_counts) in data["followers"].items():
+            counts = index.followers[word] = _FollowerCounts()
+
+            # replaying the counts in order gives the same best word
+            for (follower, count) in saved_counts.items():
+                counts.increment(follower, count)
+
+        return index
+
+class NgramTrie:
+    """
+    Class that indexes the n-grams of a text in a trie, built in one pass,
+    so the most frequent follower of any prefix of up to max_n - 1 words,
+    such as "error in module", can be looked up by walking one node per
+    word of the prefix, instead of scanning the text for every query
+
+    Prefixes that start the same share their nodes, and each node keeps
+    the counts of the words that follow its prefix, with the most frequent
+    one tracked as the counts go up. Adding a word only updates the nodes
+    of the max_n - 1 prefixes that end just before it, so the text is
+    indexed in O(max_n) per word. Words are lowercased and have their
+    punctuation removed, the same as findMostFrequentFollower, and ties
+    give the same "last" word.
+
+    Args:
+        - inputList (list of strings): Text to index, can be empty.
+        - max_n (integer): Longest n-gram to index, the prefixes can be
+        up to max_n - 1 words long, at least 2.
+    """
+
+    def __init__(self, inputList: Iterable[str] = (), max_n: int = 3) -> None:
+        if max_n < 2:
+            raise ValueError("max_n must be at least 2")
+
+        self.max_n = max_n
+        self.root = _NgramNode()
+
+        # number of prefixes in the trie
+        self.size = 0
+
+        # nodes of the prefixes that end with the last word added,
+        # longest first, which the next word added follows
+        self.active = []
+
+        self.add(inputList)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, inputList: Iterable[str] | str, continue_text: bool = True) -> None:
+        """
+        Function that adds more text to the trie.
+
+        Args:
+            - inputList (list of strings or string): Text to add.
+            - continue_text (bool): Whether the text carries on from the
+            text added before, so its first words follow the last words
+            added before, or is a separate document.
+        """
+
+        if not isinstance(inputList, str):
+            inputList = " ".join(inputList)
+
+        active = self.active if continue_text else []
+        max_prefix = self.max_n - 1
+
+        for word in tokenizeString(inputList, lowercase=True):
+            next_active = []
+
+            # the prefixes that end with the word are the ones that ended
+            # just before it, one word longer, and the word on its own
+            for node in active + [self.root]:
+                if node is not self.root:
+                    if node.followers is None:
+                        node.followers = _FollowerCounts()
+                    node.followers.increment(word)
+
+                if node.depth < max_prefix:
+                    child = node.children.get(word)
+                    if child is None:
+                        child = node.children[word] = _NgramNode(node.depth + 1)
+                        self.size += 1
+                    next_active.append(child)
+
+            active = next_active
+
+        self.active = active
+
+    def mostFrequentFollower(self, prefix: str) -> str:
+        """
+        Function that returns the most frequent follower of a prefix.
+
+        Args:
+            - prefix (string): The words the follower comes after, up to
+            max_n - 1 of them.
+
+        Returns:
+            - string: The word with the highest frequency count, or if
+            an error occurs, the string of "-1" is returned. If there are
+            multiple words with the same count, then the last word with
+            that count will be returned.
+
+        Side Effects:
+            - Prints error messages to the console.
+        """
+
+        words = list(tokenizeString(prefix, lowercase=True))
+
+        if len(words) == 0 or len(words) > self.max_n - 1:
+            print(f"Err: the prefix must have between 1 and {self.max_n - 1} words.")
+            return "-1"
+
+        # walk down the trie, one word of the prefix at a time
+        node = self.root
+        for word in words:
+            node = node.children.get(word)
+            if node is None:
+                break
+
+        # if the prefix has no followers, return error code
+        if node is None or node.followers is None:
+            print("Err: the resulting dictionary was empty.")
+            return "-1"
+
+        return node.followers.best
+
+class _NgramNode:
+    """
+    Class for one node of an NgramTrie, the prefix of the words on the
+    path down to it from the root.
+    """
+
+    __slots__ = ("depth", "children", "followers")
+
+    def __init__(self, depth: int = 0) -> None:
+        # number of words in the prefix
+        self.depth = depth
+        self.children = {}
+        # counts of the words that follow the prefix, made when one does
+        self.followers = None
+
+class _FollowerCounts:
+    """
+    Class that counts the followers of one word, keeping track of the
+    most frequent follower as the counts go up, so it never needs to
+    scan the counts. Ties go to the follower that was first seen latest,
+    the same as findMaxValueFromDictionaryOfNumbers with "last".
+    """
+
+    __slots__ = ("counts", "positions", "best", "best_count")
+
+    def __init__(self) -> None:
+        self.counts = {}
+        # the order each follower was first seen in
+        self.positions = {}
+        self.best = None
+        self.best_count = 0
+
+    def increment(self, word: str, amount: int = 1) -> None:
+        """
+        Function that adds to the count of a follower.
+
+        Args:
+            - word (string): The follower.
+            - amount (integer): Positive integer to add to its count.
+        """
+
+        count = self.counts.get(word)
+        if count is None:
+            self.positions[word] = len(self.counts)
+            count = 0
+
+        count += amount
+        self.counts[word] = count
+
+        # the counts only go up, so a follower can only become the best
+        # by passing it, or by tying with it having been seen later
+        if count > self.best_count or (count == self.best_count and self.positions[word] > self.positions[self.best]):
+            self.best = word
+            self.best_count = count
+
+def findMostFrequentWordApproximate(source: str | os.PathLike | Iterable[str], exclusions: Iterable[str] | ExclusionIndex = (), method: str = "space-saving", capacity: int = 1000, epsilon: float = 0.001, delta: float = 0.01, items_end_words: bool = False) -> tuple[str, int, int]:
+    """
+    Function to approximate the most frequent word in a file, or an
+    iterable of lines or chunks of text, that does not appear in
+    exclusions, using a fixed amount of memory however long the text is
+
+    Two methods are available:
+        - "space-saving" counts at most capacity words. Any word seen
+        more than total / capacity times is always found, and each
+        count is at most total / capacity too high.
+        - "count-min" keeps a Count-Min sketch of about e / epsilon by
+        ln(1 / delta) counters. Each count is at most epsilon * total
+        too high, with probability 1 - delta.
+
+    Args:
+        - source (string, path or iterable of strings): Path of a UTF-8
+        text file, or an iterable of lines or chunks of text.
+        - exclusions (iterable of strings or ExclusionIndex): Words to
+        leave out of the count.
+        - method (string): "space-saving" or "count-min".
+        - capacity (integer): Number of words the space-saving method counts.
+        - epsilon (float): Error of the count-min method, as a fraction
+        of the number of words.
+        - delta (float): Probability the count-min error is larger.
+        - items_end_words (bool): Whether each item of an iterable ends
+        a word, i.e. lines without their new lines, otherwise a word
+        split across two items is joined up.
+
+    Returns:
+        - tuple[str, int, int]: The most frequent word, its estimated
+        count, and the most the estimate can be higher than the true
+        count. If an error occurs, ("-1", 0, 0) is returned.
+
+    Side Effects:
+        - Prints error messages to the console.
+    """
+
+    if not isinstance(exclusions, ExclusionIndex):
+        exclusions = ExclusionIndex(exclusions)
+
+    words = (word for word in _streamWords(source, items_end_words=items_end_words) if word not in exclusions)
+
+    return _findHeavyHitter(words, method, capacity, epsilon, delta)
+
+def findMostFrequentFollowerApproximate(source: str | os.PathLike | Iterable[str], targetWord: str, method: str = "space-saving", capacity: int = 1000, epsilon: float = 0.001, delta: float = 0.01, items_end_words: bool = False) -> tuple[str, int, int]:
+    """
+    Function to approximate the most frequent word that follows a target
+    word in a file, or an iterable of lines or chunks of text, using a
+    fixed amount of memory however long the text is. Words are lowercased,
+    the same as findMostFrequentFollower, and the methods and their error
+    guarantees are the same as findMostFrequentWordApproximate, counted
+    over the followers of the target word.
+
+    Args:
+        - source (string, path or iterable of strings): Path of a UTF-8
+        text file, or an iterable of lines or chunks of text.
+        - targetWord (string): String used as the target word.
+        - method (string): "space-saving" or "count-min".
+        - capacity (integer): Number of words the space-saving method counts.
+        - epsilon (float): Error of the count-min method, as a fraction
+        of the number of followers.
+        - delta (float): Probability the count-min error is larger.
+        - items_end_words (bool): Whether each item of an iterable ends
+        a word, i.e. lines without their new lines, otherwise a word
+        split across two items is joined up.
+
+    Returns:
+        - tuple[str, int, int]: The most frequent follower, its estimated
+        count, and the most the estimate can be higher than the true
+        count. If an error occurs, ("-1", 0, 0) is returned.
+
+    Side Effects:
+        - Prints error messages to the console.
+    """
+
+    targetWord = " ".join(tokenizeString(targetWord, lowercase=True))
+
+    def followers() -> Iterator[str]:
+        previous = None
+
+        for word in _streamWords(source, items_end_words=items_end_words):
+            word = word.lower()
+            if previous == targetWord:
+                yield word
+            previous = word
+
+    return _findHeavyHitter(followers(), method, capacity, epsilon, delta)
+
+def _findHeavyHitter(words: Iterable[str], method: str, capacity: int, epsilon: float, delta: float) -> tuple[str, int, int]:
+    """
+    Function that runs the approximate counters over a stream of words.
+
+    Args:
+        - words (iterable of strings): Words to count.
+        - method (string): "space-saving" or "count-min".
+        - capacity (integer): Number of words the space-saving method counts.
+        - epsilon (float): Error of the count-min method.
+        - delta (float): Probability the count-min error is larger.
 
     Returns:
-        - string: The word with the highest frequency count, or if
-        an error occurs, the string of "-1" is returned. If there are
-        multiple words with the same count, then the first word with
-        that count will be returned.
+        - tuple[str, int, int]: The most frequent word, its estimated
+        count, and the most the estimate can be over by. If an error
+        occurs, ("-1", 0, 0) is returned.
 
     Side Effects:
         - Prints error messages to the console.
     """
 
-    # if input arrays don't contain values, return error code
-    if len(inputList1) == 0 or len(inputList2) == 0:
-        print("Err: one or more of the parameters were empty.")
-        return "-1"
-    
-    # remove punctuation from user inputs
-    inputList1 = removePunctuationFromString(" ".join(inputList1))
-    inputList1 = inputList1.split(" ")
-    inputList2 = removePunctuationFromString(" ".join(inputList2))
-    inputList2 = inputList2.split(" ")
+    if method not in ["space-saving", "count-min"]:
+        print(f"Err: the method must be space-saving or count-min ({method}).")
+        return ("-1", 0, 0)
 
-    # create dicionary for count of each string
-    string_count = {}
+    counter = SpaceSavingCounter(capacity) if method == "space-saving" else CountMinSketch(epsilon, delta)
 
-    # create a list by subtracking all items of inputList2 from inputList1
-    subtracted_arr = [item for item in inputList1 if item not in inputList2]
+    for word in words:
+        counter.add(word)
 
-    # if dictionary size is zero, return error code
-    if len(subtracted_arr) == 0:
-        print("Err: the resulting array was empty, inputList1 did not contain any differentiating strings.")
-        return "-1"
+    # if nothing was counted, return error code
+    if counter.total == 0:
+        print("Err: the resulting dictionary was empty.")
+        return ("-1", 0, 0)
 
-    # loop the subtracted array to add count per word
-    for str in subtracted_arr:
-        if str in string_count:
-            string_count[str] += 1
+    return counter.mostFrequent()
+
+class SpaceSavingCounter:
+    """
+    Class that finds the heavy hitters of a stream of words with the
+    Space-Saving algorithm, counting at most capacity words at a time
+
+    When a new word arrives and the counter is full, the word with the
+    lowest count is replaced, and the new word takes over its count plus
+    one, remembering the count it took over as its error. The words are
+    kept in buckets by count, so every update takes O(1) time.
+
+    Args:
+        - capacity (integer): Positive integer, the number of words counted.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, not {capacity}.")
+
+        self.capacity = capacity
+        # number of words added
+        self.total = 0
+        # count and error of each word counted
+        self.counts = {}
+        self.errors = {}
+        # words with each count, and the lowest count
+        self.buckets = {}
+        self.min_count = 0
+
+    def add(self, word: str) -> None:
+        """
+        Function that adds one occurrence of a word.
+
+        Args:
+            - word (string): The word.
+        """
+
+        self.total += 1
+        count = self.counts.get(word)
+
+        if count is not None:
+            self._moveBucket(word, count)
+            return
+
+        if len(self.counts) < self.capacity:
+            self.counts[word] = 0
+            self.errors[word] = 0
+            self.buckets.setdefault(0, {})[word] = None
+            self.min_count = 0
         else:
-            string_count[str] = 1
+            # replace a word with the lowest count
+            bucket = self.buckets[self.min_count]
+            evicted = next(iter(bucket))
+            del bucket[evicted]
+            del self.counts[evicted]
+            del self.errors[evicted]
 
-    # if dictionary size is zero, return error code
-    if len(string_count.keys()) == 0:
-        print("Err: the resulting dictionary was empty.")
-        return "-1"
+            bucket[word] = None
+            self.counts[word] = self.min_count
+            self.errors[word] = self.min_count
 
-    # find largest value in dictionary & return its key
-    # or return the first if there are tying words
-    return findMaxValueFromDictionaryOfNumbers(string_count)
+        self._moveBucket(word, self.counts[word])
+
+    def _moveBucket(self, word: str, count: int) -> None:
+        """
+        Function that adds one to the count of a counted word, moving it
+        to the next bucket.
+
+        Args:
+            - word (string): The word.
+            - count (integer): Its count before the move.
+        """
 
-def findMostFrequentFollower(inputList: list[str], targetWord: str) -> str:
+        bucket = self.buckets[count]
+        del bucket[word]
+
+        if not bucket:
+            del self.buckets[count]
+            # the word moved up from the lowest count was the last one
+            # with it, so it is still the lowest
+            if count == self.min_count:
+                self.min_count = count + 1
+
+        self.buckets.setdefault(count + 1, {})[word] = None
+        self.counts[word] = count + 1
+
+    def mostFrequent(self) -> tuple[str, int, int]:
+        """
+        Function that returns the word with the highest count.
+
+        Returns:
+            - tuple[str, int, int]: The word, its count, and the most its
+            count can be higher than its true count.
+        """
+
+        word = findMaxValueFromDictionaryOfNumbers(self.counts)
+
+        return (word, self.counts[word], self.errors[word])
+
+class CountMinSketch:
     """
-    Function to find the most frequent word in an array that follows
-    a target word
+    Class that estimates the counts of a stream of words with a Count-Min
+    sketch, a grid of counters where each word adds one to a counter in
+    every row, and its estimate is the lowest of its counters. The word
+    with the highest estimate so far is kept, so the heaviest word can be
+    found without storing the words.
 
     Args:
-        - inputList1 (list of strings): List of strings.
-        - targetWord (string): String used as the target word of the function.
+        - epsilon (float): Error as a fraction of the number of words,
+        between 0 and 1, sets the width of the grid.
+        - delta (float): Probability the error is larger, between 0 and 1,
+        sets the depth of the grid.
+        - seed (integer): Seed for the row hash functions, the same seed
+        gives the same estimates in every process.
+    """
 
-    Returns:
-        - string: The word with the highest frequency count, or if
-        an error occurs, the string of "-1" is returned. If there are
-        multiple words with the same count, then the last word with
-        that count will be returned.
+    # Mersenne prime used by the row hash functions
+    PRIME = (1 << 61) - 1
 
-    Side Effects:
-        - Prints error messages to the console.
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01, seed: int = 0) -> None:
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError(f"epsilon and delta must be between 0 and 1, not {epsilon} and {delta}.")
+
+        self.epsilon = epsilon
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.rows = [array("Q", [0]) * self.width for _ in range(self.depth)]
+
+        # one (a * h + b) mod PRIME hash function for each row
+        generator = random.Random(seed)
+        self.hashes = [(generator.randrange(1, self.PRIME), generator.randrange(self.PRIME)) for _ in range(self.depth)]
+
+        # the builtin hash() of a string is salted per process, so words
+        # are hashed with blake2b keyed by the seed to keep runs repeatable
+        self.key = generator.getrandbits(128).to_bytes(16, "little")
+
+        self.total = 0
+        self.best = None
+        self.best_count = 0
+
+    def add(self, word: str) -> None:
+        """
+        Function that adds one occurrence of a word.
+
+        Args:
+            - word (string): The word.
+        """
+
+        self.total += 1
+        value = int.from_bytes(hashlib.blake2b(word.encode("utf-8"), digest_size=8, key=self.key).digest(), "little")
+        estimate = self.total
+
+        for (row, (a, b)) in zip(self.rows, self.hashes):
+            column = (a * value + b) % self.PRIME % self.width
+            row[column] += 1
+            if row[column] < estimate:
+                estimate = row[column]
+
+        # only a strictly higher estimate replaces the best word,
+        # so the first word to reach a count keeps it
+        if estimate > self.best_count:
+            self.best = word
+            self.best_count = estimate
+
+    def mostFrequent(self) -> tuple[str, int, int]:
+        """
+        Function that returns the word with the highest estimate.
+
+        Returns:
+            - tuple[str, int, int]: The word, its estimated count, and
+            the most the estimate can be higher than the true count,
+            with probability 1 - delta.
+        """
+
+        return (self.best, self.best_count, math.ceil(self.epsilon * self.total))
+
+class Vocabulary:
     """
+    Class that interns words, mapping each distinct word to a dense
+    integer ID, in the order the words were first added, so text can be
+    stored and counted as arrays of IDs instead of strings.
 
-    # if inputs don't contain values, return error code
-    if len(inputList) == 0 or len(targetWord) == 0:
-        print("Err: one or more of the parameters were empty.")
-        return "-1" 
-    
-    # remove punctuation from user inputs
-    inputList = removePunctuationFromString(" ".join(inputList))
-    inputList = inputList.split(" ")
-    targetWord = removePunctuationFromString(targetWord)
+    Args:
+        - words (iterable of strings): Words to add, can be empty.
+    """
 
-    # create dicionary for count of each string
-    string_count = {}
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        # ID of each word, and the word of each ID
+        self.ids = {}
+        self.words = []
 
-    # loop indexes of the inputList array
-    for index in range(0, len(inputList)):
-        # if index + 1 doesn't overflow the container and current word
-        # at index in inputList equals the target word
-        if index + 1 != len(inputList) and inputList[index].lower() == targetWord.lower():
-            # set the next word to a variable
-            str = inputList[index + 1].lower()
+        # the same for the lowercased words, kept apart so lowercasing
+        # never adds words, and the lowercase ID of each word ID so far
+        self.lowercase_ids = {}
+        self.lowercase_words = []
+        self._lowercase_map = None
 
-            # up the count of the word in the string_count dictionary
-            if str in string_count:
-                string_count[str] += 1
-            else:
-                string_count[str] = 1
+        for word in words:
+            self.add(word)
 
-    # find largest value in dictionary & return its key
-    # or return the last word if there are tying words
-    return findMaxValueFromDictionaryOfNumbers(string_count, "last")
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def add(self, word: str) -> int:
+        """
+        Function that returns the ID of a word, adding it if it is new.
+
+        Args:
+            - word (string): The word.
+
+        Returns:
+            - integer: The ID of the word.
+        """
+
+        word_id = self.ids.get(word)
+
+        if word_id is None:
+            word_id = self.ids[word] = len(self.words)
+            self.words.append(word)
+
+        return word_id
+
+    def encode(self, inputList: list[str] | str) -> EncodedText:
+        """
+        Function that tokenizes text and encodes its words as IDs, adding
+        the new words to the vocabulary.
+
+        Args:
+            - inputList (list of strings or string): Text to encode.
+
+        Returns:
+            - EncodedText: The encoded text.
+        """
+
+        if not isinstance(inputList, str):
+            inputList = " ".join(inputList)
+
+        # the IDs are collected in a compact array of unsigned ints
+        ids = array("I", (self.add(word) for word in tokenizeString(inputList)))
+
+        return EncodedText(self, ids)
+
+    def lowercaseIds(self) -> np.ndarray:
+        """
+        Function that maps the ID of each word to the ID of the same word
+        lowercased, in the separate lowercase_words, without adding to the
+        vocabulary. The map is cached, and only the words added since the
+        last call are lowercased.
+
+        Returns:
+            - np.ndarray: Array where index i holds the lowercase ID of
+            word i, as long as the vocabulary.
+        """
+
+        import numpy as np
+
+        known = 0 if self._lowercase_map is None else len(self._lowercase_map)
+
+        if self._lowercase_map is None or known < len(self.words):
+            new_ids = []
+            for word in self.words[known:]:
+                lowercase = word.lower()
+                lowercase_id = self.lowercase_ids.get(lowercase)
+                if lowercase_id is None:
+                    lowercase_id = self.lowercase_ids[lowercase] = len(self.lowercase_words)
+                    self.lowercase_words.append(lowercase)
+                new_ids.append(lowercase_id)
+
+            new_map = np.array(new_ids, dtype=np.uint32)
+            self._lowercase_map = new_map if self._lowercase_map is None else np.concatenate((self._lowercase_map, new_map))
+
+        return self._lowercase_map
+
+class EncodedText:
+    """
+    Class that holds text as an array of word IDs from a Vocabulary, which
+    findMostFrequentWord and findMostFrequentFollower accept in place of a
+    list of strings. The words are counted with np.bincount, and follower
+    pairs are packed into int64s as (first ID << 32) | second ID, so no
+    strings are hashed while counting.
+
+    Args:
+        - vocabulary (Vocabulary): Vocabulary the IDs belong to.
+        - ids (array): Word IDs of the text, in order.
+    """
+
+    def __init__(self, vocabulary: Vocabulary, ids: array) -> None:
+        import numpy as np
+
+        self.vocabulary = vocabulary
+        # view of the array, without copying it
+        self.ids = np.frombuffer(ids, dtype=np.uint32) if len(ids) else np.empty(0, dtype=np.uint32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def words(self) -> list[str]:
+        """
+        Function that decodes the IDs back into words.
+
+        Returns:
+            - list[str]: The words of the text.
+        """
+
+        return [self.vocabulary.words[word_id] for word_id in self.ids.tolist()]
+
+    def counts(self) -> np.ndarray:
+        """
+        Function that counts each word of the text.
+
+        Returns:
+            - np.ndarray: Array where index i holds the count of word i,
+            as long as the vocabulary.
+        """
+
+        import numpy as np
+
+        return np.bincount(self.ids, minlength=len(self.vocabulary))
+
+    def bigrams(self, lowercase: bool = False) -> np.ndarray:
+        """
+        Function that packs each pair of neighbouring words into an int64,
+        as (first ID << 32) | second ID.
+
+        Args:
+            - lowercase (bool): Whether to use the IDs of the lowercased
+            words, from Vocabulary.lowercaseIds.
+
+        Returns:
+            - np.ndarray: The packed pairs, in order.
+        """
+
+        import numpy as np
+
+        ids = self.vocabulary.lowercaseIds()[self.ids] if lowercase else self.ids
+        ids = ids.astype(np.int64)
+
+        return (ids[:-1] << 32) | ids[1:]
+
+    def mostFrequentWord(self, exclusions: ExclusionIndex) -> str:
+        """
+        Function that returns the most frequent word of the text that is
+        not excluded, the same as findMostFrequentWord.
+
+        Args:
+            - exclusions (ExclusionIndex): Words to leave out of the count.
+
+        Returns:
+            - string: The word with the highest frequency count, or if
+            an error occurs, the string of "-1" is returned. If there are
+            multiple words with the same count, then the first word with
+            that count in the text will be returned.
+
+        Side Effects:
+            - Prints error messages to the console.
+        """
+
+        import numpy as np
+
+        counts = self.counts()
+
+        # zero the counts of the excluded words
+        excluded = [word_id for (word_id, word) in enumerate(self.vocabulary.words) if word in exclusions]
+        counts[excluded] = 0
+
+        max_count = counts.max() if counts.size else 0
+
+        # if every word was excluded, return error code
+        if max_count == 0:
+            print("Err: the resulting array was empty, inputList1 did not contain any differentiating strings.")
+            return "-1"
+
+        # the first of the tying words to appear in the text
+        tying = np.flatnonzero(counts == max_count)
+        first_position = np.flatnonzero(np.isin(self.ids, tying))[0]
+
+        return self.vocabulary.words[self.ids[first_position]]
+
+    def mostFrequentFollower(self, targetWord: str) -> str:
+        """
+        Function that returns the most frequent follower of targetWord,
+        the same as findMostFrequentFollower.
+
+        Args:
+            - targetWord (string): String used as the target word.
+
+        Returns:
+            - string: The word with the highest frequency count, or if
+            an error occurs, the string of "-1" is returned. If there are
+            multiple words with the same count, then the last word with
+            that count will be returned.
+
+        Side Effects:
+            - Prints error messages to the console.
+        """
+
+        import numpy as np
+
+        bigrams = self.bigrams(lowercase=True)
+        target_id = self.vocabulary.lowercase_ids.get(" ".join(tokenizeString(targetWord, lowercase=True)))
+
+        # the low 32 bits of the pairs starting with the target word
+        followers = bigrams[(bigrams >> 32) == target_id] & 0xFFFFFFFF if target_id is not None else bigrams[:0]
+
+        # if the target word has no followers, return error code
+        if followers.size == 0:
+            print("Err: the resulting dictionary was empty.")
+            return "-1"
+
+        counts = np.bincount(followers)
+        tying = np.flatnonzero(counts == counts.max())
+
+        # the tying follower that was first seen latest
+        (unique_ids, first_positions) = np.unique(followers, return_index=True)
+        tying_positions = first_positions[np.isin(unique_ids, tying)]
+        tying_ids = unique_ids[np.isin(unique_ids, tying)]
+
+        return self.vocabulary.lowercase_words[tying_ids[np.argmax(tying_positions)]]
+
+class SlidingWindowCounter:
+    """
+    Class that counts the words in a sliding window over a live stream,
+    either the last max_words words, the last max_seconds seconds, or both
+
+    Each word is counted when it arrives and uncounted when it leaves the
+    window, in O(1) time. The words are kept in buckets by count, and the
+    highest count is updated as words move between buckets, so the most
+    frequent word never needs a rescan of the window. If multiple words
+    have the highest count, the first to reach that count is returned.
+
+    Args:
+        - max_words (integer): Number of words in the window, if None,
+        the window is only limited by time.
+        - max_seconds (float): Age in seconds of the oldest word in the
+        window, if None, the window is only limited by words.
+        - exclusions (iterable of strings or ExclusionIndex): Words to
+        leave out of the count.
+    """
+
+    def __init__(self, max_words: int | None = None, max_seconds: float | None = None, exclusions: Iterable[str] | ExclusionIndex = ()) -> None:
+        if max_words is None and max_seconds is None:
+            raise ValueError("max_words, max_seconds or both must be set.")
+
+        if not isinstance(exclusions, ExclusionIndex):
+            exclusions = ExclusionIndex(exclusions)
+
+        self.max_words = max_words
+        self.max_seconds = max_seconds
+        self.exclusions = exclusions
+
+        # words in the window and the time they arrived, oldest first
+        self.window = deque()
+        # count of each word in the window
+        self.counts = {}
+        # words with each count, and the highest count
+        self.buckets = {}
+        self.max_count = 0
+
+    def add(self, word: str, timestamp: float | None = None) -> None:
+        """
+        Function that adds a word to the window, then removes the words
+        that have left the window.
+
+        Args:
+            - word (string): The word.
+            - timestamp (float): Time the word arrived in seconds, defaults
+            to time.monotonic().
+        """
+
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        if word not in self.exclusions:
+            self.window.append((word, timestamp))
+            self._changeCount(word, 1)
+
+        self.expire(timestamp)
+
+    def addText(self, text: str, timestamp: float | None = None) -> None:
+        """
+        Function that tokenizes text and adds each of its words.
+
+        Args:
+            - text (string): The text.
+            - timestamp (float): Time the text arrived in seconds, defaults
+            to time.monotonic().
+        """
+
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        for word in tokenizeString(text):
+            self.add(word, timestamp)
+
+    def expire(self, now: float | None = None) -> None:
+        """
+        Function that removes the words that have left the window.
+
+        Args:
+            - now (float): Current time in seconds, defaults to
+            time.monotonic(), the same clock add() uses.
+        """
+
+        if now is None:
+            now = time.monotonic()
+
+        if self.max_words is not None:
+            while len(self.window) > self.max_words:
+                (word, _) = self.window.popleft()
+                self._changeCount(word, -1)
+
+        if self.max_seconds is not None:
+            while self.window and self.window[0][1] < now - self.max_seconds:
+                (word, _) = self.window.popleft()
+                self._changeCount(word, -1)
+
+    def mostFrequent(self, now: float | None = None) -> str:
+        """
+        Function that returns the most frequent word in the window.
+
+        Args:
+            - now (float): Current time in seconds, so words that have
+            aged out since the last word arrived are removed first,
+            defaults to time.monotonic().
+
+        Returns:
+            - string: The word with the highest count, or if the window
+            is empty, the string of "-1" is returned.
+
+        Side Effects:
+            - Prints error messages to the console.
+        """
+
+        self.expire(now)
+
+        # if the window is empty, return error code
+        if self.max_count == 0:
+            print("Err: the resulting dictionary was empty.")
+            return "-1"
+
+        return next(iter(self.buckets[self.max_count]))
+
+    def _changeCount(self, word: str, change: int) -> None:
+        """
+        Function that adds or removes one from the count of a word,
+        moving it between buckets, and updating the highest count.
+
+        Args:
+            - word (string): The word.
+            - change (integer): 1 or -1.
+        """
+
+        count = self.counts.get(word, 0)
+        new_count = count + change
+
+        if count:
+            bucket = self.buckets[count]
+            del bucket[word]
+
+            if not bucket:
+                del self.buckets[count]
+                # the word moved down from the highest count was the
+                # last one with it, so its new count is the highest
+                if count == self.max_count and change < 0:
+                    self.max_count = new_count
+
+        if new_count:
+            self.counts[word] = new_count
+            self.buckets.setdefault(new_count, {})[word] = None
+            if new_count > self.max_count:
+                self.max_count = new_count
+        else:
+            del self.counts[word]
 
 def findMaxValueFromDictionaryOfNumbers(dictionary: dict, target: str = "first") -> str:
     """
@@ -151,17 +1812,110 @@ def findMaxValueFromDictionaryOfNumbers(dictionary: dict, target: str = "first")
         print("Err: the resulting dictionary was empty.")
         return "-1"
     
+    # the top value is the top 1 values
+    return findTopValuesFromDictionaryOfNumbers(dictionary, 1, target)[0]
+
+def findTopValuesFromDictionaryOfNumbers(dictionary: dict | np.ndarray, k: int, target: str = "first") -> list:
+    """
+    Function to find the keys of the k items in a dictionary with the
+    highest values, in order from the highest. If multiple items have the
+    same value, then the target will put the first or last of them ahead.
+
+    The items are passed through a heap of at most k items, so it runs
+    in O(n log k) without sorting or copying the dictionary. The counts
+    can also be a 1-D NumPy array, i.e. indexed by word ID, which is
+    scanned in chunks, so the whole array is never copied.
+
+    Args:
+        - dictionary (dictionary or np.ndarray): Dictionary with string
+        keys and int values, or an array of counts.
+        - k (integer): Positive integer, the number of keys to return.
+        - target (string): String with the value of first or last, to
+        target the output position of tying items.
+
+    Returns:
+        - list: The keys of the items with the highest values, or the
+        indexes for an array, at most k of them. If an error occurs,
+        an empty list is returned.
+
+    Side Effects:
+        - Prints error messages to the console.
+    """
+
+    # if dictionary size is zero, return error code
+    if len(dictionary) == 0:
+        print("Err: the resulting dictionary was empty.")
+        return []
+
+    if k < 1:
+        print(f"Err: the number of values requested was lower than one ({k}).")
+        return []
+
     # make sure target only targets first or last element
     if target not in ["first", "last"]:
         target = "first"
-    
-    # get max value in variable
-    max_value = dictionary[max(dictionary, key=dictionary.get)]
 
-    # create a list of the keys from the dictionary where the value equals max_value
-    array_of_max_values = [key for key, value in dictionary.items() if value == max_value]
+    if not isinstance(dictionary, dict):
+        return _findTopValuesFromArray(dictionary, k, target)
+
+    # nlargest keeps the order of tying items, so looping the items
+    # backwards puts the last of the tying items ahead
+    items = dictionary.items() if target == "first" else reversed(dictionary.items())
+
+    return [key for (key, _) in heapq.nlargest(k, items, key=itemgetter(1))]
+
+def _findTopValuesFromArray(counts: np.ndarray, k: int, target: str) -> list[int]:
+    """
+    Function to find the indexes of the k highest counts in an array,
+    looking at one chunk at a time, and keeping the best k so far.
+
+    Args:
+        - counts (np.ndarray): 1-D array of counts.
+        - k (integer): Positive integer, the number of indexes to return.
+        - target (string): "first" or "last", which of the tying counts
+        go ahead.
+
+    Returns:
+        - list[int]: The indexes of the highest counts, in order from
+        the highest.
+    """
+
+    import numpy as np
+
+    counts = np.asarray(counts).ravel()
 
-    return array_of_max_values[0 if target == "first" else -1]
+    # best k values so far, and their indexes
+    best_values = counts[:0]
+    best_indexes = np.empty(0, dtype=np.int64)
+
+    for start in range(0, counts.size, TOP_VALUES_CHUNK_SIZE):
+        chunk = counts[start:start + TOP_VALUES_CHUNK_SIZE]
+
+        if chunk.size > k:
+            # partition only finds the kth highest value, it does not sort
+            threshold = np.partition(chunk, chunk.size - k)[chunk.size - k]
+            higher = np.flatnonzero(chunk > threshold)
+            tying = np.flatnonzero(chunk == threshold)
+
+            # fill the rest with the first or last of the tying values
+            needed = k - higher.size
+            tying = tying[:needed] if target == "first" else tying[tying.size - needed:]
+            indexes = np.concatenate((higher, tying))
+        else:
+            indexes = np.arange(chunk.size)
+
+        best_values = np.concatenate((best_values, chunk[indexes]))
+        best_indexes = np.concatenate((best_indexes, indexes + start))
+
+        # sort the candidates (at most 2k of them) by value, then by
+        # index, and reverse, so the highest come first, and the tying
+        # values are in the order the target asks for
+        tie_break = -best_indexes if target == "first" else best_indexes
+        order = np.lexsort((tie_break, best_values))[::-1][:k]
+        best_values = best_values[order]
+        best_indexes = best_indexes[order]
+
+    return best_indexes.tolist()
 
 def removePunctuationFromString(string: str) -> str:
     """
@@ -178,17 +1932,53 @@ def removePunctuationFromString(string: str) -> str:
     
     if len(string) == 0:
         return ""
-    
-    # list of all punctuation
-    punctuation = ["!", "\"", "#", "$", "%", "&", "'", "(", ")", "*", "+", ",", "-", ".", "/", ":", ";", "<", "=", ">", "?", "@", "[", "\\", "]", "^", "_", "`", "{", "|", "}", "~"] 
-    
-    # remove punctuation from string
-    for item in punctuation:
-        if item in string:
-            string = string.replace(item, "")
 
-    # return string, but replace double spaces with a single
-    return string.replace("  ", " ")
+    # remove punctuation from string in one pass
+    string = string.translate(PUNCTUATION_TABLE)
+
+    # return string, but replace runs of spaces with a single
+    return SPACES_PATTERN.sub(" ", string)
+
+def tokenizeString(string: str, lowercase: bool = False, unicode_punctuation: bool = False) -> Iterator[str]:
+    """
+    Generator that lazily yields the words of a string, with punctuation
+    removed by one pass of a precompiled translation table, and words
+    split on any run of whitespace, so no empty words are produced.
+
+    Args:
+        - string (string): String for the function to work on.
+        - lowercase (bool): Whether to lowercase each word.
+        - unicode_punctuation (bool): Whether to also remove all Unicode
+        punctuation and symbol characters, i.e. curly quotes and dashes,
+        not just the ASCII punctuation.
+
+    Yields:
+        - string: Each word of the string, in order.
+    """
+
+    table = _unicodePunctuationTable() if unicode_punctuation else PUNCTUATION_TABLE
+
+    for match in WORD_PATTERN.finditer(string.translate(table)):
+        yield match.group().lower() if lowercase else match.group()
+
+@cache
+def _unicodePunctuationTable() -> dict[int, None]:
+    """
+    Function that builds the translation table deleting every Unicode
+    punctuation (P*) and symbol (S*) character, on the first call only,
+    as it checks every code point.
+
+    Returns:
+        - dict[int, None]: Translation table for str.translate.
+    """
+
+    table = dict(PUNCTUATION_TABLE)
+
+    for code_point in range(sys.maxunicode + 1):
+        if unicodedata.category(chr(code_point))[0] in "PS":
+            table[code_point] = None
+
+    return table
 
 def findMostFrequentWordUserInteraction() -> str:
     """
@@ -244,6 +2034,18 @@ def findMostFrequentFollowerUserInteraction() -> str:
         print(f"The word '{target}' did not appear in your sentence, so the program could not function.")
     return result
 
-# run the main functions, with user input
-findMostFrequentWordUserInteraction()
-findMostFrequentFollowerUserInteraction()
\ No newline at end of file
+def main() -> None:
+    """
+    Function that runs the main functions with user input, used when
+    the file is run as a script.
+
+    Side Effects:
+        - Prints messages to the console and requires input from the user.
+    """
+
+    # run the main functions, with user input
+    findMostFrequentWordUserInteraction()
+    findMostFrequentFollowerUserInteraction()
+
+if __name__ == "__main__":
+    main()
@@ -3,32 +3,59 @@ knights_tour.py
 
 Author: Liam Mills
 Created: 2025-10-21
-Last Modified: 2025-10-31
+Last Modified: 2026-10-17
 
 Implements various functions related to the closed Knight's tour problem.
 
 Dependencies:
-    - NumPy
+    - NumPy (imported on first use)
 
 Functions:
     - KnightsTour() -> None: Function for users to interact with the main Knight's tour functions in this file.
-    - KnightsTourBacktracking(startingPosition: tuple[int, int]) -> tuple[bool, list[list[int]]]: Function that runs through the closed Knight's tour problem using a backtracking algorithm.
-    - KnightsTourLasVegas(startingPosition: tuple[int, int]) -> tuple[bool, list[list[int]]]: Function that runs through the closed Knight's tour problem using a Las Vegas algorithm.
-    - KnightsTourPrintBoard(visited: list[list[int]]) -> None: Function that takes a list of list of ints as positions on the board, and uses them to output in the console a representation of the movements around the board during the Knight's tour.
-    - KnightsTourSuccessRate(type: str, loop_limit: int) -> float: Function that runs the Knight's tour algorithm repeatedly, with random start positions to determine the success rate of the algorithm.
+    - KnightsTourBacktracking(startingPosition: tuple[int, int], boardSize: tuple[int, int] = (BOARD_SIZE, BOARD_SIZE), node_limit: int | None = None) -> tuple[bool, list[list[int]]]: Function that runs through the closed Knight's tour problem using a backtracking algorithm.
+    - KnightsTourLasVegas(startingPosition: tuple[int, int], boardSize: tuple[int, int] = (BOARD_SIZE, BOARD_SIZE), rng: np.random.Generator | None = None) -> tuple[bool, list[list[int]]]: Function that runs through the closed Knight's tour problem using a Las Vegas algorithm.
+    - KnightsTourWarnsdorff(startingPosition: tuple[int, int], boardSize: tuple[int, int] = (BOARD_SIZE, BOARD_SIZE)) -> tuple[bool, list[list[int]]]: Function that runs through the closed Knight's tour problem using Warnsdorff's rule, in linear time.
+    - KnightsTourDivideAndConquer(boardSize: tuple[int, int], startingPosition: tuple[int, int] = (0, 0), path: str | os.PathLike | None = None) -> np.ndarray | None:
+    Function that builds a closed Knight's tour of a large even-sized board in O(rows * cols) time, by stitching together tours of small blocks.
+    - KnightsTourPrintBoard(visited: list[list[int]], boardSize: tuple[int, int] = (BOARD_SIZE, BOARD_SIZE)) -> None: Function that takes a list of list of ints as positions on the board, and uses them to output in the console a representation of the movements around the board during the Knight's tour.
+    - KnightsTourSuccessRate(type: str, loop_limit: int, boardSize: tuple[int, int] = (BOARD_SIZE, BOARD_SIZE), seed: int | None = None, processes: int | None = None,
+    target_width: float | None = None, node_limit: int | None = 10 ** 6) -> float: Function that runs the Knight's tour algorithm repeatedly, with random start positions to determine the success rate of the algorithm.
+    - KnightsTourSuccessStatistics(type: str, max_runs: int, boardSize: tuple[int, int] = (BOARD_SIZE, BOARD_SIZE), seed: int | None = None, processes: int | None = None,
+    batch_size: int = 64, target_width: float | None = None, confidence: float = 0.95, node_limit: int | None = 10 ** 6) -> dict: Function that measures the success rate of an algorithm over
+    seeded runs on a process pool, with a Wilson confidence interval, the rate of each start square, and an early stop.
 """
 
-import numpy as np
+from __future__ import annotations
+
+import math
+import os
+from array import array
+from functools import lru_cache
+from statistics import NormalDist
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # CONSTANTS
-# board size (minimum board size is 6 for closed)
+# default board size (minimum board size is 6 for closed),
+# every tour function takes the rows and columns of its board
 BOARD_SIZE = 8
 
-# board area
-BOARD_AREA = BOARD_SIZE * BOARD_SIZE
+# number of board sizes to keep the move tables of, the least
+# recently used board size is dropped first
+MOVE_TABLE_CACHE_SIZE = 32
+
+# number of runs of a success rate between each check of its
+# confidence interval, fixed so the runs do not depend on the processes
+SUCCESS_RATE_BATCH_SIZE = 64
 
-# target step count
-TARGET_STEPS = BOARD_AREA + 1
+# most moves each backtracking run of a success rate makes before it
+# counts as a failure, so a start that stalls cannot block the pool
+SUCCESS_RATE_NODE_LIMIT = 10 ** 6
+
+# Warnsdorff tie-breaks, in the order they are tried
+WARNSDORFF_TIE_BREAKS = ["start", "pohl"]
 
 # array of possible moves the knight can take
 # the knight can move in an L shape of 1 square along
@@ -60,12 +87,12 @@ def KnightsTour() -> None:
     while should_outer_loop:
         print("Which type would you like to use?")
         # get input from the client
-        tour_type = input("For backtracking, type 1. For Las Vegas, type 2. To exit, type 3: ")
+        tour_type = input("For backtracking, type 1. For Las Vegas, type 2. For Warnsdorff, type 3. To exit, type 4: ")
 
         # test if the input is valid
-        if tour_type not in ["1", "2", "3"]:
+        if tour_type not in ["1", "2", "3", "4"]:
             print("Error: you entered an incorrect option. The program will retry this step.\n")
-        elif tour_type in ["1", "2"]:
+        elif tour_type in ["1", "2", "3"]:
             # initialise inner loop
             should_inner_loop = True
 
@@ -105,8 +132,10 @@ def KnightsTour() -> None:
                     # based on user input
                     if tour_type == "1":
                         (bool, arr) = KnightsTourBacktracking((row, col))
-                    else:
+                    elif tour_type == "2":
                         (bool, arr) = KnightsTourLasVegas((row, col))
+                    else:
+                        (bool, arr) = KnightsTourWarnsdorff((row, col))
                     
                     # set whether the function was a success or
                     # failure from the boolean the functions return
@@ -120,127 +149,666 @@ def KnightsTour() -> None:
             print("Your tour has finished, the program will return to the main menu.\n")
 
         else:
-            # the user typed '3', so they want to exit
+            # the user typed '4', so they want to exit
             # break outer loop
             should_outer_loop = False
             break
     
     print("Thank you for using the Knights Tour by Liam Mills, goodbye!")
 
-def KnightsTourBacktracking(startingPosition: tuple[int, int]) -> tuple[bool, list[list[int]]]:
+def KnightsTourBacktracking(startingPosition: tuple[int, int], boardSize: tuple[int, int] = (BOARD_SIZE, BOARD_SIZE), node_limit: int | None = None) -> tuple[bool, list[list[int]]]:
     """
     Function that runs through the closed Knight's tour problem using a backtracking algorithm.
 
+    The moves are tried in the order of POSSIBLE_MOVES, on a compact search
+    state: squares are numbered row * columns + col, the visited squares
+    are the bits of an integer, the in-board neighbours of every square are
+    looked up in a precomputed table, and the stack is a preallocated array.
+    A move is also skipped when it leaves a square that can no longer be
+    toured through, which never skips a tour, so the tour found is the same
+    as trying every move.
+
+    The search is still exponential in the worst case, and a few starts
+    do not finish in any reasonable time, i.e. (6, 5) on an 8 by 8 board
+    runs for minutes. node_limit bounds the search, so callers can give
+    up on those starts.
+
     Args:
         - startingPosition (tuple[int, int]): Tuple of integers used
         as the starting position for the program.
+        - boardSize (tuple[int, int]): Number of rows and columns of
+        the board, defaults to BOARD_SIZE by BOARD_SIZE.
+        - node_limit (integer or None): Most moves the search makes
+        before it gives up and fails, or no limit if it is None.
 
     Returns:
         - tuple[bool, list[list[int]]]: This is a boolean on whether the
         program has completed the Knight's tour successfully, and a list of
         the row and column values as ints of the moves the knight made on the tour.
+        If the tour fails, the list is empty.
+
+    Side Effects:
+        - Prints error messages to the console.
     """
 
+    # the start has to be on the board, return failure
+    if not _KnightsTourCheckBoard(startingPosition, boardSize):
+        return (False, [])
+
     # row and col coordinates from user defined starting postion
     (start_row, start_col) = startingPosition
+    (rows, cols) = boardSize
 
-    # positions to process, a stack to process next steps,
-    # or if that fails, then the previous step
-    # initialised with starting position
-    #
-    # row = row value of current position
-    # col = col value of the current position
-    # step_count = step count of the element, used to mark the board,
-    # and judge if the loop has got to the end
-    # next_step_index = used as an index for the POSSIBLE_MOVES arr,
-    # to get the position of the next move
-    # 
-    positions_to_process = [{
-        'row': start_row,
-        'col': start_col,
-        'step_count': 1,
-        'next_step_index': 0
-    }]
+    tour = _KnightsTourSearch(int(start_row) * cols + int(start_col), rows, cols, node_limit)
 
-    # positions to return, an array to store the order of the steps
-    # to output at the end of the function
-    position_order = [[start_row, start_col]]
+    # return tuple of:
+    # boolean: if a closed tour was found
+    # list[list[int]]: the order in which we toured the board
+    return (len(tour) == rows * cols + 1, [[square // cols, square % cols] for square in tour])
 
-    while len(positions_to_process):
-        # get current postion data from the top element in
-        # the positions_to_process stack
-        current_row = positions_to_process[0]['row']
-        current_col = positions_to_process[0]['col']
-        step_count = positions_to_process[0]['step_count']
-        next_step_index = positions_to_process[0]['next_step_index']
-        
-        # if step_count equals target steps
-        # we are at the end point
-        if step_count == TARGET_STEPS:
-            # exit the main loop
-            break
-        
-        # if index is below the size of
-        # POSSIBLE_MOVES array, then there are possible moves
-        # to take
-        if next_step_index < len(POSSIBLE_MOVES):
-            # get next possible move
-            (add_row, add_col) = POSSIBLE_MOVES[next_step_index]
-            # create new coordinates by adding the move values
-            # with the current row and col values
-            new_row = current_row + add_row
-            new_col = current_col + add_col
-
-            # up the current elements next_step_index incase we need
-            # to backtrack, or this move is invalid
-            positions_to_process[0]['next_step_index'] += 1
-            
-            # if the new row and col coordinates are possible moves
-            # OR, the tour is at the last step, and that it is going back to the 
-            # first spot
-            if (new_row >= 0 and new_col >= 0 and new_row < BOARD_SIZE and new_col < BOARD_SIZE and [new_row,new_col] not in position_order) or (step_count == BOARD_AREA and new_row == start_row and new_col == start_col):
-                # add this element to the positions_to_process to start
-                # looking through moves from there
-                positions_to_process.insert(0, {
-                    'row': new_row,
-                    'col': new_col,
-                    'step_count': step_count + 1,
-                    'next_step_index': 0
-                })
-                # add the new coordinates to the position_order array
-                position_order.append([new_row, new_col])
+def _KnightsTourSearch(start: int, rows: int, cols: int, node_limit: int | None = None) -> list[int]:
+    """
+    Function that searches for a closed Knight's tour with backtracking,
+    trying the moves in the order of POSSIBLE_MOVES.
+
+    Next to the visited bits, the search keeps the number of unvisited
+    neighbours of every square. Once a square is unvisited, it still needs
+    a square to come from, the current one or an unvisited one, and a
+    square to go to, an unvisited one or the start if it is the last, so a
+    move is skipped if it leaves a square with fewer than two of these, or
+    leaves the start with no unvisited neighbour to come back from.
+
+    Args:
+        - start (integer): Square number of the starting position.
+        - rows (integer): Number of rows of the board.
+        - cols (integer): Number of columns of the board.
+        - node_limit (integer or None): Most moves to make, or no limit
+        if it is None.
+
+    Returns:
+        - list[int]: The square numbers of the tour, ending back on the
+        start, or an empty list if there is no tour, or the node limit
+        was reached first.
+    """
+
+    neighbours = _KnightsTourNeighbourTable(rows, cols)
+    neighbour_bits = _KnightsTourNeighbourBits(rows, cols)
+    area = rows * cols
+    last_depth = area - 1
+
+    # whether each square can move back to the start
+    near_start = [0] * area
+    for square in neighbours[start]:
+        near_start[square] = 1
+
+    # number of unvisited neighbours of each square
+    degree = array("b", _KnightsTourDegreeTable(rows, cols))
+    for square in neighbours[start]:
+        degree[square] -= 1
+
+    # the stack, the square at each depth and the index of the next
+    # neighbour to try from it
+    path = array("i", [0]) * area
+    next_index = array("B", [0]) * area
+
+    path[0] = start
+    visited = 1 << start
+    depth = 0
+
+    # moves left before giving up, it never reaches 0 without a limit
+    remaining = node_limit if node_limit is not None else -1
+
+    while depth >= 0:
+        square = path[depth]
+
+        # every square is visited, the tour is closed if it can move back
+        if depth == last_depth:
+            if near_start[square]:
+                return path.tolist() + [start]
+            options = ()
         else:
-            # else, the next_step_index is equal to the len of 
-            # POSSIBLE_MOVES array, so there are no moves left to make
-            # the current item is not working so we need to backtrack
-            # remove this item from positions_to_process
-            removed = positions_to_process.pop(0)
+            options = neighbours[square]
+
+        index = next_index[depth]
+
+        # no moves left from this square, backtrack
+        if index == len(options):
+            visited ^= 1 << square
+            for neighbour in neighbours[square]:
+                degree[neighbour] += 1
+            depth -= 1
+            continue
+
+        next_index[depth] = index + 1
+        move = options[index]
+
+        if (visited >> move) & 1:
+            continue
+
+        # visit the move, and check it leaves a tour possible
+        visited |= 1 << move
+        for neighbour in neighbours[move]:
+            degree[neighbour] -= 1
+
+        possible = depth + 1 == last_depth or degree[start] > 0
+
+        if possible and depth + 1 < last_depth:
+            # squares next to the move can still come from it
+            for neighbour in neighbours[move]:
+                if not (visited >> neighbour) & 1 and degree[neighbour] + near_start[neighbour] < 1:
+                    possible = False
+                    break
 
-            # remove from position_order
-            position_order.remove([removed['row'], removed['col']])
+            # squares that were next to the current square lost it
+            if possible:
+                for neighbour in neighbours[square]:
+                    if not (visited >> neighbour) & 1 and not (neighbour_bits[move] >> neighbour) & 1 and degree[neighbour] + near_start[neighbour] < 2:
+                        possible = False
+                        break
+
+        if possible:
+            remaining -= 1
+            if remaining == 0:
+                return []
+
+            depth += 1
+            path[depth] = move
+            next_index[depth] = 0
+        else:
+            # undo the visit, and try the next move
+            visited ^= 1 << move
+            for neighbour in neighbours[move]:
+                degree[neighbour] += 1
+
+    return []
+
+def _KnightsTourCheckBoard(startingPosition: tuple[int, int], boardSize: tuple[int, int]) -> bool:
+    """
+    Function that checks the board has squares, and the starting position
+    is on it.
+
+    Args:
+        - startingPosition (tuple[int, int]): The starting position.
+        - boardSize (tuple[int, int]): Number of rows and columns of the board.
+
+    Returns:
+        - bool: Whether the board and starting position can be toured.
+
+    Side Effects:
+        - Prints error messages to the console.
+    """
+
+    (start_row, start_col) = startingPosition
+    (rows, cols) = boardSize
+
+    if rows < 1 or cols < 1:
+        print("Err: the board must have at least one row and one column.")
+        return False
+
+    if not (0 <= start_row < rows and 0 <= start_col < cols):
+        print("Err: the starting position is not on the board.")
+        return False
+
+    return True
+
+@lru_cache(maxsize=MOVE_TABLE_CACHE_SIZE)
+def _KnightsTourNeighbourTable(rows: int, cols: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Function that builds the in-board neighbours of every square, in the
+    order of POSSIBLE_MOVES, built once per board size.
+
+    Args:
+        - rows (integer): Number of rows of the board.
+        - cols (integer): Number of columns of the board.
+
+    Returns:
+        - tuple[tuple[int, ...], ...]: The square numbers of the neighbours
+        of each square, indexed by square number.
+    """
+
+    return tuple(
+        tuple((row + add_row) * cols + col + add_col for (add_row, add_col) in POSSIBLE_MOVES if 0 <= row + add_row < rows and 0 <= col + add_col < cols)
+        for row in range(rows)
+        for col in range(cols)
+    )
+
+@lru_cache(maxsize=MOVE_TABLE_CACHE_SIZE)
+def _KnightsTourNeighbourBits(rows: int, cols: int) -> tuple[int, ...]:
+    """
+    Function that builds the neighbours of every square as the bits of
+    an integer, built once per board size.
+
+    Args:
+        - rows (integer): Number of rows of the board.
+        - cols (integer): Number of columns of the board.
+
+    Returns:
+        - tuple[int, ...]: The neighbour bits of each square, indexed by
+        square number.
+    """
+
+    return tuple(sum(1 << neighbour for neighbour in options) for options in _KnightsTourNeighbourTable(rows, cols))
+
+@lru_cache(maxsize=MOVE_TABLE_CACHE_SIZE)
+def _KnightsTourDegreeTable(rows: int, cols: int) -> array:
+    """
+    Function that builds the number of in-board neighbours of every
+    square, built once per board size. The searches copy it, as it
+    is shared.
+
+    Args:
+        - rows (integer): Number of rows of the board.
+        - cols (integer): Number of columns of the board.
+
+    Returns:
+        - array: The number of neighbours of each square, indexed by
+        square number.
+    """
+
+    return array("b", [len(options) for options in _KnightsTourNeighbourTable(rows, cols)])
+
+def KnightsTourWarnsdorff(startingPosition: tuple[int, int], boardSize: tuple[int, int] = (BOARD_SIZE, BOARD_SIZE)) -> tuple[bool, list[list[int]]]:
+    """
+    Function that runs through the closed Knight's tour problem using Warnsdorff's rule.
+
+    The knight always moves to the square with the fewest onward moves.
+    Ties go to the square furthest from the start, so the tour works its
+    way back to finish near the start, or with Pohl's rule, to the square
+    whose onward squares have the fewest onward moves summed, then by the
+    move order. A move is never made to the last unvisited square next to
+    the start, unless it is the last square of the tour, so there is
+    always a way back to close the tour. No move is ever undone, so a
+    tour takes linear time, and if one does not close, it is retried with
+    the move order rotated, then with the other tie-break.
+
+    Args:
+        - startingPosition (tuple[int, int]): Tuple of integers used
+        as the starting position for the program.
+        - boardSize (tuple[int, int]): Number of rows and columns of
+        the board, defaults to BOARD_SIZE by BOARD_SIZE.
+
+    Returns:
+        - tuple[bool, list[list[int]]]: This is a boolean on whether the
+        program has completed the Knight's tour successfully, and a list of
+        the row and column values as ints of the moves the knight made on the tour.
+        If every try fails, the list is the longest try.
+
+    Side Effects:
+        - Prints error messages to the console.
+    """
+
+    # the start has to be on the board, return failure
+    if not _KnightsTourCheckBoard(startingPosition, boardSize):
+        return (False, [])
+
+    # row and col coordinates from user defined starting postion
+    (start_row, start_col) = startingPosition
+    (rows, cols) = boardSize
+    target_steps = rows * cols + 1
+
+    start = int(start_row) * cols + int(start_col)
+    longest = []
+
+    # try each tie-break and rotation of the move order until a tour closes
+    for tie_break in WARNSDORFF_TIE_BREAKS:
+        for rotation in range(len(POSSIBLE_MOVES)):
+            tour = _KnightsTourWarnsdorffPath(start, rotation, tie_break, rows, cols)
+
+            if len(tour) > len(longest):
+                longest = tour
+
+            if len(tour) == target_steps:
+                break
+
+        if len(longest) == target_steps:
+            break
 
     # return tuple of:
-    # boolean: if the length of position_order equals the TARGET_STEPS
+    # boolean: if a closed tour was found
     # list[list[int]]: the order in which we toured the board
-    return (len(position_order) == TARGET_STEPS, position_order)
-    
-def KnightsTourLasVegas(startingPosition: tuple[int, int]) -> tuple[bool, list[list[int]]]:
+    return (len(longest) == target_steps, [[square // cols, square % cols] for square in longest])
+
+def _KnightsTourWarnsdorffPath(start: int, rotation: int, tie_break: str, rows: int, cols: int) -> list[int]:
+    """
+    Function that makes one Warnsdorff tour, without backtracking.
+
+    Args:
+        - start (integer): Square number of the starting position.
+        - rotation (integer): Number of places to rotate the move order
+        by, for the last tie-break.
+        - tie_break (string): "start" for the square furthest from the
+        start, or "pohl" for Pohl's rule.
+        - rows (integer): Number of rows of the board.
+        - cols (integer): Number of columns of the board.
+
+    Returns:
+        - list[int]: The square numbers of the tour, ending back on the
+        start if it closed, or as far as it got if it did not.
+    """
+
+    neighbours = _KnightsTourNeighbourTable(rows, cols)
+    area = rows * cols
+    last_step = area - 1
+
+    # whether each square can move back to the start
+    near_start = [False] * area
+    for square in neighbours[start]:
+        near_start[square] = True
+
+    # number of unvisited neighbours of each square
+    degree = array("b", _KnightsTourDegreeTable(rows, cols))
+    for square in neighbours[start]:
+        degree[square] -= 1
+
+    (start_row, start_col) = divmod(start, cols)
+
+    visited = bytearray(area)
+    visited[start] = 1
+    path = [start]
+    square = start
+
+    for step in range(1, area):
+        options = neighbours[square]
+        best = -1
+        best_key = None
+
+        for index in range(len(options)):
+            move = options[(index + rotation) % len(options)]
+
+            if visited[move]:
+                continue
+
+            if step < last_step:
+                # keep the last way back to the start open
+                if near_start[move] and degree[start] == 1:
+                    continue
+
+                # a square with no onward moves is a dead end
+                if degree[move] == 0:
+                    continue
+
+            # fewest onward moves, then the tie-break, then the first
+            # in the move order
+            if tie_break == "start":
+                (row, col) = divmod(move, cols)
+                key = (degree[move], -((row - start_row) ** 2 + (col - start_col) ** 2))
+            else:
+                key = (degree[move], sum(degree[onward] for onward in neighbours[move] if not visited[onward]))
+
+            if best_key is None or key < best_key:
+                best = move
+                best_key = key
+
+        # no move left, the tour is stuck
+        if best == -1:
+            return path
+
+        visited[best] = 1
+        for neighbour in neighbours[best]:
+            degree[neighbour] -= 1
+
+        path.append(best)
+        square = best
+
+    # every square is visited, close the tour if it can move back
+    if near_start[square]:
+        path.append(start)
+
+    return path
+
+def KnightsTourDivideAndConquer(boardSize: tuple[int, int], startingPosition: tuple[int, int] = (0, 0), path: str | os.PathLike | None = None) -> np.ndarray | None:
+    """
+    Function that builds a closed Knight's tour of a large board by divide and conquer, in the style of Parberry.
+
+    The board is tiled with blocks of 6, 8 or 10 rows and columns, each
+    toured once per block size and cached. The blocks are split in half
+    again and again, and going back up, the tours of the two halves are
+    stitched into one at the seam between them: a tour edge on each side
+    of the seam is swapped for the two knight moves that cross the seam
+    between their ends. The tour is held as the two tour neighbours of
+    each square in a NumPy array, and is walked from the starting
+    position into the board, so the whole build takes O(rows * cols) time.
+
+    Args:
+        - boardSize (tuple[int, int]): Number of rows and columns of the
+        board, both even and at least 6.
+        - startingPosition (tuple[int, int]): Square the tour starts and
+        ends on, which is numbered 1.
+        - path (string, path or None): Path of a .npy file to write the
+        board to as the tour is walked, instead of keeping it in memory.
+
+    Returns:
+        - np.ndarray or None: The board, as int32 step numbers from 1 to
+        rows * cols, in memory or memory mapped to path. If an error
+        occurs, None is returned.
+
+    Side Effects:
+        - Prints error messages to the console.
+        - Writes the file at path, if one is given.
+    """
+
+    import numpy as np
+
+    (rows, cols) = boardSize
+
+    # every even size of at least 6 can be tiled with the blocks
+    if rows < 6 or cols < 6 or rows % 2 or cols % 2:
+        print("Err: the board must have an even number of rows and columns, of at least 6.")
+        return None
+
+    if not _KnightsTourCheckBoard(startingPosition, boardSize):
+        return None
+
+    # the two tour neighbours of each square
+    links = np.empty((rows * cols, 2), dtype=np.int32)
+
+    # the edges of the blocks, in rows and columns
+    row_edges = _KnightsTourBlockEdges(rows)
+    col_edges = _KnightsTourBlockEdges(cols)
+
+    _KnightsTourBuild(links, cols, row_edges, col_edges, 0, len(row_edges) - 1, 0, len(col_edges) - 1)
+
+    if path is None:
+        board = np.empty(boardSize, dtype=np.int32)
+    else:
+        board = np.lib.format.open_memmap(path, mode="w+", dtype=np.int32, shape=boardSize)
+
+    # walk the tour, numbering the squares into the board as it goes
+    neighbours = memoryview(links.reshape(-1))
+    steps = memoryview(board.reshape(-1))
+
+    previous = -1
+    square = int(startingPosition[0]) * cols + int(startingPosition[1])
+
+    for step in range(1, rows * cols + 1):
+        steps[square] = step
+        following = neighbours[2 * square]
+
+        if following == previous:
+            following = neighbours[2 * square + 1]
+
+        (previous, square) = (square, following)
+
+    if path is not None:
+        board.flush()
+
+    return board
+
+def _KnightsTourBlockEdges(length: int) -> list[int]:
+    """
+    Function that splits a side of the board into blocks of 6, 8 or 10,
+    using as many 10s as it can.
+
+    Args:
+        - length (integer): Even length of the side, at least 6.
+
+    Returns:
+        - list[int]: Where each block starts, followed by length.
+    """
+
+    (tens, remainder) = divmod(length, 10)
+
+    # 2 and 4 are made up by trading a 10 for two smaller blocks
+    if remainder == 2:
+        sizes = [10] * (tens - 1) + [6, 6]
+    elif remainder == 4:
+        sizes = [10] * (tens - 1) + [6, 8]
+    else:
+        sizes = [10] * tens + ([remainder] if remainder else [])
+
+    edges = [0]
+    for size in sizes:
+        edges.append(edges[-1] + size)
+
+    return edges
+
+@lru_cache(maxsize=MOVE_TABLE_CACHE_SIZE)
+def _KnightsTourBaseTour(rows: int, cols: int) -> np.ndarray:
+    """
+    Function that finds a closed tour of a small block, found once per
+    block size.
+
+    Args:
+        - rows (integer): Number of rows of the block.
+        - cols (integer): Number of columns of the block.
+
+    Returns:
+        - np.ndarray: The rows and columns of the squares of the tour,
+        in order, without going back to the start.
+    """
+
+    import numpy as np
+
+    (success, tour) = KnightsTourWarnsdorff((0, 0), (rows, cols))
+
+    if not success:
+        (success, tour) = KnightsTourBacktracking((0, 0), (rows, cols))
+
+    return np.array(tour[:-1], dtype=np.int32)
+
+def _KnightsTourBuild(links: np.ndarray, cols: int, row_edges: list[int], col_edges: list[int], top: int, bottom: int, left: int, right: int) -> None:
+    """
+    Function that tours a rectangle of blocks, touring each half and
+    stitching them together.
+
+    Args:
+        - links (np.ndarray): The two tour neighbours of each square, updated in place.
+        - cols (integer): Number of columns of the board.
+        - row_edges (list[int]): Where each row of blocks starts, followed by the number of rows.
+        - col_edges (list[int]): Where each column of blocks starts, followed by the number of columns.
+        - top, bottom (integers): Rows of blocks of the rectangle, bottom excluded.
+        - left, right (integers): Columns of blocks of the rectangle, right excluded.
+    """
+
+    import numpy as np
+
+    # one block, copy the base tour into it
+    if bottom - top == 1 and right - left == 1:
+        (row, col) = (row_edges[top], col_edges[left])
+        tour = _KnightsTourBaseTour(row_edges[bottom] - row, col_edges[right] - col)
+
+        squares = (tour[:, 0] + row) * cols + tour[:, 1] + col
+        links[squares, 0] = np.roll(squares, 1)
+        links[squares, 1] = np.roll(squares, -1)
+        return
+
+    # split across the longer side, so the seams stay short
+    if row_edges[bottom] - row_edges[top] >= col_edges[right] - col_edges[left] and bottom - top > 1:
+        middle = (top + bottom) // 2
+        _KnightsTourBuild(links, cols, row_edges, col_edges, top, middle, left, right)
+        _KnightsTourBuild(links, cols, row_edges, col_edges, middle, bottom, left, right)
+        _KnightsTourStitch(links, cols, row_edges[middle], (col_edges[left], col_edges[right]), True)
+    else:
+        middle = (left + right) // 2
+        _KnightsTourBuild(links, cols, row_edges, col_edges, top, bottom, left, middle)
+        _KnightsTourBuild(links, cols, row_edges, col_edges, top, bottom, middle, right)
+        _KnightsTourStitch(links, cols, col_edges[middle], (row_edges[top], row_edges[bottom]), False)
+
+def _KnightsTourStitch(links: np.ndarray, cols: int, seam: int, span: tuple[int, int], across_rows: bool) -> None:
+    """
+    Function that joins the two tours on either side of a seam into one.
+    It looks along the seam for a tour edge (a, b) before it, and (c, d)
+    after it, where a to c and b to d are knight moves, then swaps the
+    two edges for the two moves. Two cycles joined at both ends make a
+    single cycle.
+
+    Args:
+        - links (np.ndarray): The two tour neighbours of each square, updated in place.
+        - cols (integer): Number of columns of the board.
+        - seam (integer): Row, or column, the second tour starts at.
+        - span (tuple[int, int]): Columns, or rows, the seam runs along, the end excluded.
+        - across_rows (bool): Whether the seam is between rows, or between columns.
+    """
+
+    (start, end) = span
+
+    # the squares as (across, along) the seam
+    def square(across: int, along: int) -> int:
+        return across * cols + along if across_rows else along * cols + across
+
+    def coordinates(number: int) -> tuple[int, int]:
+        (row, col) = divmod(number, cols)
+        return (row, col) if across_rows else (col, row)
+
+    for along in range(start, end):
+        for across in (seam - 1, seam - 2):
+            a = square(across, along)
+            for (add_across, add_along) in POSSIBLE_MOVES:
+                # c has to be just after the seam, inside the span
+                (c_across, c_along) = (across + add_across, along + add_along)
+                if not (seam <= c_across < seam + 2 and start <= c_along < end):
+                    continue
+
+                c = square(c_across, c_along)
+                for b in links[a].tolist():
+                    (b_across, b_along) = coordinates(b)
+                    for d in links[c].tolist():
+                        (d_across, d_along) = coordinates(d)
+                        if sorted((abs(b_across - d_across), abs(b_along - d_along))) == [1, 2]:
+                            # swap the edges a-b and c-d for a-c and b-d
+                            links[a][links[a] == b] = c
+                            links[b][links[b] == a] = d
+                            links[c][links[c] == d] = a
+                            links[d][links[d] == c] = b
+                            return
+
+    raise RuntimeError("no stitch was found along the seam")
+
+def KnightsTourLasVegas(startingPosition: tuple[int, int], boardSize: tuple[int, int] = (BOARD_SIZE, BOARD_SIZE), rng: np.random.Generator | None = None) -> tuple[bool, list[list[int]]]:
     """
     Function that runs through the closed Knight's tour problem using a Las Vegas algorithm.
 
     Args:
         - startingPosition (tuple[int, int]): Tuple of integers used
         as the starting position for the program.
+        - boardSize (tuple[int, int]): Number of rows and columns of
+        the board, defaults to BOARD_SIZE by BOARD_SIZE.
+        - rng (np.random.Generator or None): Generator to draw the moves
+        from, or the global np.random state if it is None.
 
     Returns:
         - tuple[bool, list[list[int]]]: This is a boolean on whether the
         program has completed the Knight's tour successfully, and a list of
         the row and column values as ints of the moves the knight made on the tour.
+
+    Side Effects:
+        - Prints error messages to the console.
     """
 
+    import numpy as np
+
+    # the start has to be on the board, return failure
+    if not _KnightsTourCheckBoard(startingPosition, boardSize):
+        return (False, [])
+
     # row and col coordinates from user defined starting postion
     (start_row, start_col) = startingPosition
 
+    # board size, area and target step count
+    (rows, cols) = boardSize
+    board_area = rows * cols
+    target_steps = board_area + 1
+
     # positions to process, a stack to process next steps,
     # or if that fails, then the previous step
     # initialised with starting position
@@ -274,7 +842,7 @@ def KnightsTourLasVegas(startingPosition: tuple[int, int]) -> tuple[bool, list[l
         # if step_count equals target steps
         # or all the POSSIBLE_MOVES have been attempted in 
         # attempted_positions, then we are at the end point
-        if step_count == TARGET_STEPS or len(attempted_positions) == len(POSSIBLE_MOVES):
+        if step_count == target_steps or len(attempted_positions) == len(POSSIBLE_MOVES):
             # exit the main loop
             break
         
@@ -285,7 +853,10 @@ def KnightsTourLasVegas(startingPosition: tuple[int, int]) -> tuple[bool, list[l
 
         while loop_for_next_attempt:
             # randomly get the index for the POSSIBLE_MOVES array
-            index = np.random.randint(0, len(POSSIBLE_MOVES), 1)[0]
+            if rng is None:
+                index = np.random.randint(0, len(POSSIBLE_MOVES), 1)[0]
+            else:
+                index = rng.integers(0, len(POSSIBLE_MOVES))
             (row, col) = POSSIBLE_MOVES[index]
 
             # if these coordinates have not already been attempted
@@ -304,7 +875,7 @@ def KnightsTourLasVegas(startingPosition: tuple[int, int]) -> tuple[bool, list[l
         # if the new row and col coordinates are possible moves
         # OR, the tour is at the last step, and that it is going back to the 
         # first spot
-        if (new_row >= 0 and new_col >= 0 and new_row < BOARD_SIZE and new_col < BOARD_SIZE and [new_row,new_col] not in position_order) or (step_count == BOARD_AREA and new_row == start_row and new_col == start_col):
+        if (new_row >= 0 and new_col >= 0 and new_row < rows and new_col < cols and [new_row,new_col] not in position_order) or (step_count == board_area and new_row == start_row and new_col == start_col):
             # add this element to the positions_to_process to start
             # looking through moves from there
             positions_to_process.insert(0, {
@@ -317,30 +888,34 @@ def KnightsTourLasVegas(startingPosition: tuple[int, int]) -> tuple[bool, list[l
             position_order.append([new_row, new_col])
 
     # return tuple of:
-    # boolean: if the length of position_order equals the TARGET_STEPS
+    # boolean: if the length of position_order equals the target_steps
     # list[list[int]]: the order in which we toured the board
-    return (len(position_order) == TARGET_STEPS, position_order)
+    return (len(position_order) == target_steps, position_order)
 
-def KnightsTourPrintBoard(visited: list[list[int]]) -> None:
+def KnightsTourPrintBoard(visited: list[list[int]], boardSize: tuple[int, int] = (BOARD_SIZE, BOARD_SIZE)) -> None:
     """
     Function that takes a list of list of ints as positions on the board, and uses them to output in the console a representation of the movements around the board during the Knight's tour.
 
     Args:
         - visited (list[list[int]]): List of the row and column values
         as ints of the moves the knight made on the tour.
+        - boardSize (tuple[int, int]): Number of rows and columns of
+        the board, defaults to BOARD_SIZE by BOARD_SIZE.
 
     Side Effects:
         - Prints a matrix depicting the Knight's tour positions as
         ints in the cells it landed in.
     """
+
+    import numpy as np
     
     # define board of zeros, set all to 0
-    board = np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=int)
+    board = np.zeros(boardSize, dtype=int)
 
     # loop termination number, which if the tour is successful,
     # we want the terminator one less than the length of 
     # the array as this square will already be filled with a one
-    terminator = len(visited) - 1 if TARGET_STEPS == len(visited) else len(visited)
+    terminator = len(visited) - 1 if board.size + 1 == len(visited) else len(visited)
 
     for i in range(0, terminator):
         # get the row and column value
@@ -354,55 +929,212 @@ def KnightsTourPrintBoard(visited: list[list[int]]) -> None:
 
     return
 
-def KnightsTourSuccessRate(type: str, loop_limit: int) -> float:
+def KnightsTourSuccessRate(type: str, loop_limit: int, boardSize: tuple[int, int] = (BOARD_SIZE, BOARD_SIZE), seed: int | None = None, processes: int | None = None, target_width: float | None = None, node_limit: int | None = SUCCESS_RATE_NODE_LIMIT) -> float:
     """
     Function that runs the Knight's tour algorithm repeatedly, with random start positions to determine the success rate of the algorithm.
 
+    The runs are spread over a process pool by KnightsTourSuccessStatistics,
+    each with its own seeded random stream, so the same seed gives the same
+    rate whatever the number of processes.
+
     Args:
+        - type (string): "Backtracking", "Las Vegas" or "Warnsdorff", the
+        algorithm to run, falls back to "Backtracking".
         - loop_limit (integer): Positive integer larger than one, used
         as the max number of runs in the for loop.
+        - boardSize (tuple[int, int]): Number of rows and columns of
+        the board, defaults to BOARD_SIZE by BOARD_SIZE.
+        - seed (integer or None): Seed of the runs, a random one is
+        picked if it is None.
+        - processes (integer or None): Number of worker processes,
+        defaults to the number of CPUs.
+        - target_width (float or None): Stop early once the confidence
+        interval of the rate is narrower than this.
+        - node_limit (integer or None): Most moves of each backtracking
+        run, a run that reaches it is a failure, or no limit if it is None.
 
     Returns:
         - float: The final success rate, of the number of successes
-        divided by the amount of runs (loop_limit arguement).
+        divided by the amount of runs (loop_limit arguement, or
+        fewer if it stopped early).
 
     Side Effects:
         - Prints messages to the console to let the user know
         the function is running and to print the success rate 
         to the console.
     """
-    
+
+    # let the user know the program has started
+    print(f"Starting calculation of success rate for the {type} Knights Tour with {loop_limit} run{'s' if loop_limit > 1 else ''}.\n")
+
+    statistics = KnightsTourSuccessStatistics(type, loop_limit, boardSize, seed, processes, target_width=target_width, node_limit=node_limit)
+
+    # print and return success rate
+    (lower, upper) = statistics["interval"]
+    print(f"The success rate is: {statistics['rate']}")
+    print(f"The {statistics['confidence']:.0%} confidence interval is: {lower:.4f} to {upper:.4f}, over {statistics['runs']} runs with seed {statistics['seed']}.")
+    return statistics["rate"]
+
+def KnightsTourSuccessStatistics(type: str, max_runs: int, boardSize: tuple[int, int] = (BOARD_SIZE, BOARD_SIZE), seed: int | None = None, processes: int | None = None, batch_size: int = SUCCESS_RATE_BATCH_SIZE, target_width: float | None = None, confidence: float = 0.95, node_limit: int | None = SUCCESS_RATE_NODE_LIMIT) -> dict:
+    """
+    Function that measures the success rate of a Knight's tour algorithm over runs from random start positions, on a process pool.
+
+    Run i draws its start position, and the Las Vegas moves, from its own
+    NumPy Generator, seeded with the i-th child of the seed, so every run
+    is the same wherever it runs. The runs are done in batches of
+    batch_size, and after each batch the Wilson confidence interval of
+    the rate is checked, stopping early once it is narrower than
+    target_width. The batches do not depend on the number of processes,
+    so the same seed gives the same result whatever it is.
+
+    Backtracking runs stop after node_limit moves and count as failures,
+    as a few starts are exponential, i.e. (6, 5) on an 8 by 8 board,
+    and would otherwise hold up the whole pool. The limit counts moves,
+    not time, so the result still only depends on the seed.
+
+    Args:
+        - type (string): "Backtracking", "Las Vegas" or "Warnsdorff", the
+        algorithm to run, falls back to "Backtracking".
+        - max_runs (integer): Most runs to do.
+        - boardSize (tuple[int, int]): Number of rows and columns of
+        the board, defaults to BOARD_SIZE by BOARD_SIZE.
+        - seed (integer or None): Seed of the runs, a random one is
+        picked if it is None.
+        - processes (integer or None): Number of worker processes,
+        defaults to the number of CPUs, 1 runs them in this process.
+        - batch_size (integer): Number of runs between the early stop checks.
+        - target_width (float or None): Stop early once the confidence
+        interval is narrower than this, or never if it is None.
+        - confidence (float): Confidence level of the interval, between 0 and 1.
+        - node_limit (integer or None): Most moves of each backtracking
+        run, a run that reaches it is a failure, or no limit if it is None.
+
+    Returns:
+        - dictionary: type, seed, runs, successes, rate, confidence and
+        interval (the lower and upper bound), stopped_early, and
+        square_runs, square_successes and square_rates, NumPy arrays of
+        the board size of the runs, successes and rate (NaN if it was
+        never started on) of each start square.
+    """
+
+    import multiprocessing
+
+    import numpy as np
+
     # set a fallback in case the user doesn't supply the correct type
-    if type not in ["Backtracking", "Las Vegas"]:
+    if type not in ["Backtracking", "Las Vegas", "Warnsdorff"]:
         type = "Backtracking"
 
-    # set up array to contain successful runs
-    success_arr = []
+    # pick a seed that can be reported, so the run can be repeated
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy)
 
-    # let the user know the program has started
-    print(f"Starting calculation of success rate for the {type} Knights Tour with {loop_limit} run{'s' if loop_limit > 1 else ''}.\n")
+    square_runs = np.zeros(boardSize, dtype=np.int64)
+    square_successes = np.zeros(boardSize, dtype=np.int64)
+    (runs, successes) = (0, 0)
+    (lower, upper) = (0.0, 1.0)
+    stopped_early = False
 
-    # loop up to the loop_limit number
-    for i in range(0, loop_limit):
-        # get random array on ints from zero to BOARD_SIZE
-        random = np.random.randint(0, BOARD_SIZE, 2)
+    pool = multiprocessing.Pool(processes) if processes != 1 else None
 
-        # get the boolean value from the functions
-        if type == "Backtracking":
-            (truthy, _) = KnightsTourBacktracking((random[0], random[1]))
-        else:
-            (truthy, _) = KnightsTourLasVegas((random[0], random[1]))
+    try:
+        while runs < max_runs:
+            batch = [(type, boardSize, seed, index, node_limit) for index in range(runs, min(runs + max(1, batch_size), max_runs))]
+            results = pool.map(_KnightsTourSuccessRun, batch) if pool is not None else [_KnightsTourSuccessRun(run) for run in batch]
 
-        # if true, push boolean into the array
-        if truthy:
-            success_arr.append(truthy)
+            for (row, col, success) in results:
+                square_runs[row, col] += 1
+                square_successes[row, col] += success
+                successes += success
 
-    # calculate the success rate by dividing the success_rate by the loop_limit number
-    # unless the success rate is zero, then just return zero
-    success_rate = len(success_arr) / loop_limit if len(success_arr) > 0 else 0.0
+            runs += len(batch)
+            (lower, upper) = _KnightsTourWilsonInterval(successes, runs, confidence)
 
-    # print and return success rate
-    print(f"The success rate is: {success_rate}")
-    return success_rate
+            if target_width is not None and upper - lower < target_width:
+                stopped_early = runs < max_runs
+                break
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    # rate of each start square, NaN where none of the runs started
+    square_rates = np.full(boardSize, np.nan)
+    np.divide(square_successes, square_runs, out=square_rates, where=square_runs > 0)
+
+    return {
+        "type": type,
+        "seed": seed,
+        "runs": runs,
+        "successes": successes,
+        "rate": successes / runs if runs > 0 else 0.0,
+        "confidence": confidence,
+        "interval": (lower, upper),
+        "stopped_early": stopped_early,
+        "square_runs": square_runs,
+        "square_successes": square_successes,
+        "square_rates": square_rates,
+    }
+
+def _KnightsTourSuccessRun(run: tuple[str, tuple[int, int], int, int, int | None]) -> tuple[int, int, bool]:
+    """
+    Function that does one run of KnightsTourSuccessStatistics, from a
+    start position drawn from the run's own random stream.
+
+    Args:
+        - run (tuple[str, tuple[int, int], int, int, int | None]): The
+        algorithm, board size, seed, index and node limit of the run.
+
+    Returns:
+        - tuple[int, int, bool]: The row and column of the start
+        position, and whether the tour was a success.
+    """
+
+    import numpy as np
+
+    (type, boardSize, seed, index, node_limit) = run
+
+    # the index-th child of the seed, the same as SeedSequence(seed).spawn
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+    (row, col) = (int(value) for value in rng.integers(0, boardSize))
+
+    if type == "Backtracking":
+        (truthy, _) = KnightsTourBacktracking((row, col), boardSize, node_limit)
+    elif type == "Las Vegas":
+        (truthy, _) = KnightsTourLasVegas((row, col), boardSize, rng)
+    else:
+        (truthy, _) = KnightsTourWarnsdorff((row, col), boardSize)
+
+    return (row, col, truthy)
+
+def _KnightsTourWilsonInterval(successes: int, runs: int, confidence: float) -> tuple[float, float]:
+    """
+    Function that works out the Wilson score interval of a success rate.
+
+    Args:
+        - successes (integer): Number of successes.
+        - runs (integer): Number of runs.
+        - confidence (float): Confidence level, between 0 and 1.
+
+    Returns:
+        - tuple[float, float]: The lower and upper bound of the rate.
+    """
+
+    if runs == 0:
+        return (0.0, 1.0)
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    rate = successes / runs
+
+    denominator = 1 + z * z / runs
+    centre = (rate + z * z / (2 * runs)) / denominator
+    half_width = z * math.sqrt(rate * (1 - rate) / runs + z * z / (4 * runs * runs)) / denominator
+
+    # the bounds are exact at no successes, or all successes
+    lower = 0.0 if successes == 0 else max(0.0, centre - half_width)
+    upper = 1.0 if successes == runs else min(1.0, centre + half_width)
+
+    return (lower, upper)
 
-KnightsTour()
\ No newline at end of file
+if __name__ == "__main__":
+    KnightsTour()
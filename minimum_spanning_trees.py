@@ -3,26 +3,33 @@ minimum_spanning_trees.py
 
 Author: Liam Mills
 Created: 2025-10-16
-Last Modified: 2025-11-2
+Last Modified: 2026-10-17
 
 Implements functions to work out the minimum spanning trees with famous algorithm(s), and supporting functions
 for them.
 
 Dependencies:
-    - NetworkX
-    - matplotlib
+    - NetworkX (imported on first use)
+    - matplotlib (imported on first use)
 
 Functions:
-    - kruskal(graph: nx.Graph) -> None: Takes a NetworkX connected graph, and creates a minimum spanning tree
+    - kruskal(graph: nx.Graph, verbose: bool = True) -> None: Takes a NetworkX connected graph, and creates a minimum spanning tree
     with matplotlib.pyplot.
     - sortEdgesByWeight(arr: list[tuple[str, str, dict[str, int]]]) -> list[tuple[str, str, dict[str, int]]]: A function to sort a list of edges from lowest to highest
     - drawAndShowGraph(G: nx.Graph, edge_color: str, title: str) -> None: Takes a NetworkX graph data and adds styles, before outputting to the screen with matplotlib.pyplot
+    - main() -> None: Builds a test graph and runs kruskal on it, used when the file is run as a script.
 """
 
-import networkx as nx
-import matplotlib.pyplot as mp
+from __future__ import annotations
 
-def kruskal(graph: nx.Graph) -> None:
+from typing import TYPE_CHECKING
+
+# used for the type hints only, kruskal and drawAndShowGraph
+# import the libraries themselves when they are called
+if TYPE_CHECKING:
+    import networkx as nx
+
+def kruskal(graph: nx.Graph, verbose: bool = True) -> None:
     """
     A function that takes a NetworkX connected graph, and
     creates a minimum spanning tree with matplotlib.pyplot.
@@ -31,6 +38,8 @@ def kruskal(graph: nx.Graph) -> None:
         - graph (nx.Graph): NetworkX connected graph for the
         function to iterate over while creating a minimum
         spanning tree.
+        - verbose (bool): Whether to print messages and draw the
+        graphs, turned off to time the algorithm on its own.
 
     Side Effects:
         - Prints messages to the console for the user to see.
@@ -38,11 +47,14 @@ def kruskal(graph: nx.Graph) -> None:
         matplotlib.pyplot.
     """
 
-    # state the algoritm being used
-    print("The algorithm used to create this Minimum Spanning Tree (MST) is Kruskal's algorithm, and it will be on the following graph.")
-        
-    # draw the original graph
-    drawAndShowGraph(graph, "#0000ff", "Original Connected Graph")
+    import networkx as nx
+
+    if verbose:
+        # state the algoritm being used
+        print("The algorithm used to create this Minimum Spanning Tree (MST) is Kruskal's algorithm, and it will be on the following graph.")
+
+        # draw the original graph
+        drawAndShowGraph(graph, "#0000ff", "Original Connected Graph")
 
     # Get edges from graph, put them in sorted order
     sorted_edges = sortEdgesByWeight(list(graph.edges(data=True)))
@@ -73,8 +85,9 @@ def kruskal(graph: nx.Graph) -> None:
         # add to mst 
         mst.add_weighted_edges_from([(node_one, node_two, data["weight"])])
 
-        # check if mst is still a tree
-        if nx.is_tree(mst) or nx.is_connected(mst) == False:
+        # check if mst is still a tree, or a forest of trees that
+        # have not been joined yet, either way it has no circuit
+        if nx.is_forest(mst):
             # true, update the node count
             mst_node_count = len(mst.nodes())
 
@@ -87,11 +100,12 @@ def kruskal(graph: nx.Graph) -> None:
             else:
                 mst_title = f"Current MST, weight: {mst_weight}"
 
-            # inform the user on the success
-            print(f"Edge ({node_one}, {node_two}, weight={data["weight"]}) can be added to the MST.")
-        
-            # draw the mst at each successful step
-            drawAndShowGraph(mst, title=mst_title)
+            if verbose:
+                # inform the user on the success
+                print(f"Edge ({node_one}, {node_two}, weight={data['weight']}) can be added to the MST.")
+
+                # draw the mst at each successful step
+                drawAndShowGraph(mst, title=mst_title)
             
         else:
             # false, remove the edge we just added
@@ -111,11 +125,13 @@ def kruskal(graph: nx.Graph) -> None:
             # update mst node count
             mst_node_count = len(mst.nodes())
 
-            # inform the user on the failure
-            print(f"Edge ({node_one}, {node_two}, weight={data["weight"]}) cannot be added to the MST, as it creates a circuit.")
+            if verbose:
+                # inform the user on the failure
+                print(f"Edge ({node_one}, {node_two}, weight={data['weight']}) cannot be added to the MST, as it creates a circuit.")
 
-    # print the MST size for the user
-    print(f"The final MST weight is {mst_weight}")
+    if verbose:
+        # print the MST size for the user
+        print(f"The final MST weight is {mst_weight}")
 
     # return None from the function
     return
@@ -166,6 +182,9 @@ def drawAndShowGraph(G: nx.Graph, edge_color: str = "#ff0000", title: str = "")
         - title(str): string to add extra context to the graph.
     """
 
+    import matplotlib.pyplot as mp
+    import networkx as nx
+
     if (title != ""):
         mp.title(title)
 
@@ -190,71 +209,86 @@ def drawAndShowGraph(G: nx.Graph, edge_color: str = "#ff0000", title: str = "")
 
     return
 
-# undirected graph
-G = nx.Graph()
-
-# TESTING GRAPH 1
-# add nodes
-G.add_nodes_from(["a", "b", "c", "d", "e", "f", "g"])
-
-# # add edges
-G.add_weighted_edges_from([
-    ("a", "b", 53),
-    ("a", "c", 33),
-    ("a", "d", 51),
-    ("b", "c", 5),
-    ("b", "e", 39),
-    ("c", "d", 98),
-    ("c", "f", 12),
-    ("d", "e", 49),
-    ("e", "f", 15),
-    ("e", "g", 8),
-    ("f", "g", 19),
-])
-# TESTING GRAPH 1 END
-
-# TESTING GRAPH 2 
-# add nodes
-# G.add_nodes_from(["a", "b", "c", "d", "e"])
-
-# # add edges
-# G.add_weighted_edges_from([
-#     ("a", "b", 196),
-#     ("a", "c", 429),
-#     ("a", "d", 214),
-#     ("a", "e", 374),
-#     ("b", "c", 308),
-#     ("b", "d", 466),
-#     ("b", "e", 112),
-#     ("c", "d", 169),
-#     ("c", "e", 86),
-#     ("d", "e", 225),
-# ])
-# TESTING GRAPH 2 END
-
-# TESTING GRAPH 3 
-# add nodes
-# G.add_nodes_from(["a", "b", "c", "d", "e", "z"])
-
-# add edges                      
-# G.add_weighted_edges_from([
-#     ("a", "b", 22),
-#     ("a", "c", 187),
-#     ("a", "d", 18),
-#     ("a", "e", 175),
-#     ("a", "z", 35),
-#     ("b", "c", 156),
-#     ("b", "d", 146),
-#     ("b", "e", 128),
-#     ("b", "z", 41),
-#     ("c", "d", 34),
-#     ("c", "e", 112),
-#     ("c", "z", 52),
-#     ("d", "e", 88),
-#     ("d", "z", 124),
-#     ("e", "z", 10),
-# ])
-# TESTING GRAPH 3 END
-
-# running test from the above
-kruskal(G)
\ No newline at end of file
+def main() -> None:
+    """
+    Function that builds a test graph and runs kruskal on it, used
+    when the file is run as a script.
+
+    Side Effects:
+        - Prints messages to the console and outputs graphs with
+        matplotlib.pyplot.
+    """
+
+    import networkx as nx
+
+    # undirected graph
+    G = nx.Graph()
+
+    # TESTING GRAPH 1
+    # add nodes
+    G.add_nodes_from(["a", "b", "c", "d", "e", "f", "g"])
+
+    # # add edges
+    G.add_weighted_edges_from([
+        ("a", "b", 53),
+        ("a", "c", 33),
+        ("a", "d", 51),
+        ("b", "c", 5),
+        ("b", "e", 39),
+        ("c", "d", 98),
+        ("c", "f", 12),
+        ("d", "e", 49),
+        ("e", "f", 15),
+        ("e", "g", 8),
+        ("f", "g", 19),
+    ])
+    # TESTING GRAPH 1 END
+
+    # TESTING GRAPH 2 
+    # add nodes
+    # G.add_nodes_from(["a", "b", "c", "d", "e"])
+
+    # # add edges
+    # G.add_weighted_edges_from([
+    #     ("a", "b", 196),
+    #     ("a", "c", 429),
+    #     ("a", "d", 214),
+    #     ("a", "e", 374),
+    #     ("b", "c", 308),
+    #     ("b", "d", 466),
+    #     ("b", "e", 112),
+    #     ("c", "d", 169),
+    #     ("c", "e", 86),
+    #     ("d", "e", 225),
+    # ])
+    # TESTING GRAPH 2 END
+
+    # TESTING GRAPH 3 
+    # add nodes
+    # G.add_nodes_from(["a", "b", "c", "d", "e", "z"])
+
+    # add edges                      
+    # G.add_weighted_edges_from([
+    #     ("a", "b", 22),
+    #     ("a", "c", 187),
+    #     ("a", "d", 18),
+    #     ("a", "e", 175),
+    #     ("a", "z", 35),
+    #     ("b", "c", 156),
+    #     ("b", "d", 146),
+    #     ("b", "e", 128),
+    #     ("b", "z", 41),
+    #     ("c", "d", 34),
+    #     ("c", "e", 112),
+    #     ("c", "z", 52),
+    #     ("d", "e", 88),
+    #     ("d", "z", 124),
+    #     ("e", "z", 10),
+    # ])
+    # TESTING GRAPH 3 END
+
+    # running test from the above
+    kruskal(G)
+
+if __name__ == "__main__":
+    main()